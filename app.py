@@ -3,7 +3,6 @@ import os
 import tempfile
 import stat
 import uuid
-import ctypes
 import shiboken6
 import time
 from datetime import date
@@ -25,7 +24,7 @@ from PySide6.QtWidgets import (
     QSizePolicy, QFormLayout, QSpacerItem
 )
 from PySide6.QtCore import (
-    Qt, QSettings, QTimer, QRegularExpression
+    Qt, QSettings, QTimer, QRegularExpression, QStringListModel
 )
 from PySide6.QtGui import (
     QIcon, QKeySequence, QIntValidator, QRegularExpressionValidator,
@@ -34,7 +33,7 @@ from PySide6.QtGui import (
 
 from utils import (
     resource_path, DOC_MAIN_DIR,
-    tooltip_stylesheet, label_stylesheet,
+    tooltip_stylesheet, form_label_stylesheet,
     show_error, show_info, show_success, show_warning,
     ensure_builds_directory_structure, create_build_folder, clean_build_content,
     get_build_content_dir, get_build_dir,
@@ -47,8 +46,9 @@ from widgets import (
     FileExplorer, BuildListWidget
 )
 from packaging_utils import (
-    BatchPackagingWorker, PackageInventory, PackageSpec, PackagingError,
-    validate_package_destination, validate_package_spec,
+    BatchPackagingWorker, PackageContentCheckWorker, PackageSpec,
+    PackagingError, check_package_content, validate_package_destination,
+    validate_package_spec,
 )
 from naming_utils import (
     build_dim_zip_filename, validate_dim_part, validate_dim_prefix,
@@ -60,9 +60,7 @@ from extraction_utils import (
     ExtractionRollbackError,
     MultiBuildExtractionWorker,
 )
-from config_utils import load_configurations
-from settings import SettingsDialog
-from updater import UpdateManager
+from config_utils import config_signature, load_configurations
 from version import APP_VERSION
 from session import (
     MAX_BUILDS, Build, Session, SessionRecoveryError,
@@ -82,11 +80,31 @@ log.info("Application starting...")
 
 settings = QSettings("Syst3mApps", "DIMCreator")
 
+_LOCKABLE_WIDGETS = (
+    "buildListWidget", "fileExplorer", "store_input", "prefix_input",
+    "product_name_input", "sku_input", "product_tags_input",
+    "guid_input", "product_part_input", "image_label",
+    "support_clean_input", "use_store_prefix_checkbox", "clear_button",
+    "extract_button", "package_all_button", "package_selected_button",
+    "settings_button", "generate_guid_button", "sync_container_widget",
+    "tags_button",
+)
+
+_GUID_RE = QRegularExpression(
+    r'^[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$'
+)
+
 logo_path = resource_path(
     os.path.join('assets', 'images', 'logo', 'favicon.ico')
 )
 
 
+def _write_settings(values: dict) -> None:
+    for key, value in values.items():
+        settings.setValue(key, value)
+    settings.sync()
+
+
 def _is_complete_guid(value: object) -> bool:
     if not isinstance(value, str):
         return False
@@ -110,6 +128,7 @@ class DIMPackageGUI(QWidget):
         self.doc_main_dir = DOC_MAIN_DIR
         (self.storeitems, self.store_prefixes, self.available_tags,
          self.daz_folders) = load_configurations(self.doc_main_dir)
+        self._configSignature = config_signature(self.doc_main_dir)
         self.stateTooltip = None
         
         self.session = None
@@ -122,13 +141,18 @@ class DIMPackageGUI(QWidget):
         self._save_timer.setSingleShot(True)
         self._save_timer.setInterval(500)
         self._save_timer.timeout.connect(self._debouncedSave)
+        self._previewTimer = QTimer(self)
+        self._previewTimer.setSingleShot(True)
+        self._previewTimer.setInterval(75)
+        self._previewTimer.timeout.connect(self._doUpdateZipPreview)
+        self._lastCopy = ("", 0.0)
         self.ensure_directory_structure()
         self.loadSession()
         
         setTheme(Theme.DARK)
         self.initUI()
         self.loadSettings()
-        self.updateZipPreview()
+        self._doUpdateZipPreview()
         if self._session_warning:
             QTimer.singleShot(
                 0,
@@ -137,6 +161,8 @@ class DIMPackageGUI(QWidget):
                     Qt.Vertical, duration=8000,
                 ),
             )
+        from updater import UpdateManager
+
         self.updater = UpdateManager(
             self, settings, current_version=APP_VERSION, interval_hours=24
         )
@@ -163,18 +189,17 @@ class DIMPackageGUI(QWidget):
         )
 
     def saveSettings(self):
+        values = {}
         store = self.store_input.currentText().strip()
         if store:
-            settings.setValue("store_input", store)
+            values["store_input"] = store
         try:
-            prefix = validate_dim_prefix(self.prefix_input.text())
+            values["prefix_input"] = validate_dim_prefix(self.prefix_input.text())
         except ValueError:
             pass
-        else:
-            settings.setValue("prefix_input", prefix)
-        settings.setValue("last_destination_folder", self.last_destination_folder)
-        settings.setValue("auto_prefix", self.use_store_prefix_checkbox.isChecked())
-        settings.sync()
+        values["last_destination_folder"] = self.last_destination_folder
+        values["auto_prefix"] = self.use_store_prefix_checkbox.isChecked()
+        _write_settings(values)
 
     def _preferredStoreForNewSession(self) -> str:
         preferred = settings.value("store_input", "", type=str).strip()
@@ -194,6 +219,7 @@ class DIMPackageGUI(QWidget):
         return self.operation_state is OperationState.IDLE
 
     def _setOperationState(self, state: OperationState):
+        previous = getattr(self, "operation_state", None)
         self.operation_state = state
         busy = state is not OperationState.IDLE
         if busy:
@@ -204,18 +230,11 @@ class DIMPackageGUI(QWidget):
             abort_download = getattr(image_label, "_abort_active_download", None)
             if callable(abort_download):
                 abort_download()
-        for name in (
-            "buildListWidget", "fileExplorer", "store_input", "prefix_input",
-            "product_name_input", "sku_input", "product_tags_input",
-            "guid_input", "product_part_input", "image_label",
-            "support_clean_input", "use_store_prefix_checkbox", "clear_button",
-            "extract_button", "package_all_button", "package_selected_button",
-            "settings_button", "generate_guid_button", "sync_container_widget",
-            "tags_button",
-        ):
-            widget = getattr(self, name, None)
-            if widget is not None:
-                widget.setEnabled(not busy)
+        if previous is None or (previous is not OperationState.IDLE) != busy:
+            for name in _LOCKABLE_WIDGETS:
+                widget = getattr(self, name, None)
+                if widget is not None:
+                    widget.setEnabled(not busy)
         if not busy:
             self.package_selected_button.setEnabled(self._hasCheckedBuilds())
             self.prefix_input.setEnabled(
@@ -225,8 +244,8 @@ class DIMPackageGUI(QWidget):
     def _runningWorkers(self):
         workers = []
         for name in (
-            "batch_packaging_worker", "archivePlanningWorker",
-            "extractionWorker",
+            "batch_packaging_worker", "packageCheckWorker",
+            "archivePlanningWorker", "extractionWorker",
         ):
             worker = getattr(self, name, None)
             if worker is not None and worker.isRunning():
@@ -442,19 +461,8 @@ class DIMPackageGUI(QWidget):
 
         self._setOperationState(OperationState.CLOSING)
 
-        try:
-            for attr in ("stateTooltip", "_finalTip"):
-                tip = getattr(self, attr, None)
-                if tip:
-                    try:
-                        if shiboken6.isValid(tip):
-                            tip.close()
-                            tip.deleteLater()
-                    except Exception:
-                        pass
-                    setattr(self, attr, None)
-        except Exception:
-            pass
+        self._close_tip("stateTooltip")
+        self._close_tip("_finalTip")
 
         try:
             self.saveSettings()
@@ -628,13 +636,17 @@ class DIMPackageGUI(QWidget):
             build_data = get_build_data(self.session, build)
             
             store = build_data.get('store', '')
-            if store:
-                index = self.store_input.findText(store)
-                if index >= 0:
-                    self.store_input.setCurrentIndex(index)
-            else:
-                self.store_input.setCurrentIndex(-1)
-                self.store_input.setCurrentText('')
+            signals_were_blocked = self.store_input.blockSignals(True)
+            try:
+                if store:
+                    index = self.store_input.findText(store)
+                    if index >= 0:
+                        self.store_input.setCurrentIndex(index)
+                else:
+                    self.store_input.setCurrentIndex(-1)
+                    self.store_input.setCurrentText('')
+            finally:
+                self.store_input.blockSignals(signals_were_blocked)
             
             self.product_name_input.setText(build_data.get('product_name', ''))
             
@@ -937,7 +949,11 @@ class DIMPackageGUI(QWidget):
     def openTagSelectionDialog(self):
         if not self.canMutateWorkspace():
             return
-        selected_tags = self.product_tags_input.text().split(",")
+        selected_tags = {
+            tag.strip()
+            for tag in self.product_tags_input.text().split(",")
+            if tag.strip()
+        }
 
         dialog = TagSelectionDialog(self.available_tags, selected_tags, self)
         if dialog.exec() == QDialog.Accepted:
@@ -967,9 +983,14 @@ class DIMPackageGUI(QWidget):
         return build_dim_zip_filename(prefix_raw, sku_raw, part_val, name_raw)
 
     def updateZipPreview(self):
+        self._previewTimer.start()
+
+    def _doUpdateZipPreview(self):
         try:
             if hasattr(self, 'zip_preview_edit'):
-                self.zip_preview_edit.setText(self.build_zip_filename())
+                name = self.build_zip_filename()
+                self.zip_preview_edit.setText(name)
+                self.zip_preview_edit.setToolTip(name)
                 self.zip_preview_edit.setCursorPosition(0)
         except Exception:
             pass
@@ -978,7 +999,11 @@ class DIMPackageGUI(QWidget):
 
         self.setWindowTitle("DIMCreator")
         self.setMinimumSize(1010, 800)
-        self.setStyleSheet(tooltip_stylesheet + "DIMPackageGUI{background: rgb(32, 32, 32)}")
+        self.setStyleSheet(
+            tooltip_stylesheet
+            + form_label_stylesheet
+            + "DIMPackageGUI{background: rgb(32, 32, 32)}"
+        )
 
         root = QVBoxLayout(self)
         root.setContentsMargins(12, 12, 12, 12)
@@ -1012,7 +1037,7 @@ class DIMPackageGUI(QWidget):
 
         def L(text):
             lbl = QLabel(text, self)
-            lbl.setStyleSheet(label_stylesheet)
+            lbl.setObjectName("formLabel")
             return lbl
 
         self.store_input = EditableComboBox(self)
@@ -1059,7 +1084,7 @@ class DIMPackageGUI(QWidget):
             "Enter the SKU (Stock Keeping Unit) for the package."
         )
         dash_lbl = QLabel("-", self)
-        dash_lbl.setStyleSheet(label_stylesheet)
+        dash_lbl.setObjectName("formLabel")
         self.product_part_input = CustomCompactSpinBox(self)
         self.product_part_input.setRange(1, 99)
         self.product_part_input.setValue(1)
@@ -1081,7 +1106,7 @@ class DIMPackageGUI(QWidget):
         )
         self.guid_input.setValidator(
             QRegularExpressionValidator(
-                QRegularExpression(r'^[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$'),
+                _GUID_RE,
                 self
             )
         )
@@ -1201,14 +1226,21 @@ class DIMPackageGUI(QWidget):
         f.setFamilies(["Consolas", "Cascadia Mono", "DejaVu Sans Mono", "Menlo", f.family()])
         self.zip_preview_edit.setFont(f)
 
-        self.zip_preview_edit.textChanged.connect(lambda s: self.zip_preview_edit.setToolTip(s))
 
         copy_btn = ToolButton(FIF.COPY, self)
         copy_btn.setToolTip("Copy filename to clipboard")
 
         def _copy_preview():
-            QApplication.clipboard().setText(self.zip_preview_edit.text())
-            show_info(self, "Copied", "Filename copied to clipboard.")
+            if self._previewTimer.isActive():
+                self._previewTimer.stop()
+                self._doUpdateZipPreview()
+            text = self.zip_preview_edit.text()
+            QApplication.clipboard().setText(text)
+            now = time.monotonic()
+            last_text, last_time = self._lastCopy
+            self._lastCopy = (text, now)
+            if text != last_text or now - last_time >= 1.5:
+                show_info(self, "Copied", "Filename copied to clipboard.")
 
         copy_btn.clicked.connect(_copy_preview)
 
@@ -1261,14 +1293,10 @@ class DIMPackageGUI(QWidget):
 
         root.addLayout(util_bar)
 
-        if self.current_build:
-            content_dir = get_build_content_dir(self.current_build.folder)
-        else:
-            content_dir = ""
-        
-        self.fileExplorer = FileExplorer(content_dir, self, main_gui=self)
-        self.fileExplorer.setMinimumHeight(260)
-        root.addWidget(self.fileExplorer, 1)
+        self._fileExplorerPlaceholder = QWidget(self)
+        self._fileExplorerPlaceholder.setMinimumHeight(260)
+        root.addWidget(self._fileExplorerPlaceholder, 1)
+        QTimer.singleShot(0, self._initFileExplorer)
 
         QShortcut(QKeySequence("Ctrl+G"), self, self.generateGUID)
         QShortcut(QKeySequence("Ctrl+Return"), self, self.process)
@@ -1292,12 +1320,27 @@ class DIMPackageGUI(QWidget):
         
         if self.current_build:
             self.loadBuildIntoEditor(self.current_build)
+
+    def _initFileExplorer(self):
+        placeholder = getattr(self, "_fileExplorerPlaceholder", None)
+        if placeholder is None:
+            return
+        if self.current_build:
             content_dir = get_build_content_dir(self.current_build.folder)
-            self.fileExplorer.setRootPath(content_dir)
+        else:
+            content_dir = ""
+
+        self.fileExplorer = FileExplorer(content_dir, self, main_gui=self)
+        self.fileExplorer.setMinimumHeight(260)
+        self.layout().replaceWidget(placeholder, self.fileExplorer)
+        placeholder.deleteLater()
+        self._fileExplorerPlaceholder = None
 
     def showSettingsDialog(self):
         if not self.canMutateWorkspace():
             return
+        from settings import SettingsDialog
+
         dialog = SettingsDialog(self.doc_main_dir, self)
 
         dialog.enable_template_detection_checkbox.setChecked(self.enable_template_detection)
@@ -1315,22 +1358,24 @@ class DIMPackageGUI(QWidget):
             self.enable_template_detection = dialog.enable_template_detection_checkbox.isChecked()
             self.template_destination = dialog.template_destination_field.text()
             
-            output_org_text = dialog.output_org_combo.currentText()
-            settings.setValue("output_organization", output_org_text)
-
-            settings.setValue("enable_template_detection", self.enable_template_detection)
-            settings.setValue("template_destination", self.template_destination)
-
             auto_enabled = dialog.auto_update_checkbox.isChecked()
-            settings.setValue("auto_update_check", auto_enabled)
+            _write_settings({
+                "output_organization": dialog.output_org_combo.currentText(),
+                "enable_template_detection": self.enable_template_detection,
+                "template_destination": self.template_destination,
+                "auto_update_check": auto_enabled,
+            })
             self.updater.set_auto_enabled(auto_enabled)
 
-            self._reloadConfigurationChoices()
+            if config_signature(self.doc_main_dir) != self._configSignature:
+                self._reloadConfigurationChoices()
+                self.updateSourcePrefixBasedOnStore()
 
     def _reloadConfigurationChoices(self):
         selected_store = self.store_input.currentText()
         (self.storeitems, self.store_prefixes, self.available_tags,
          self.daz_folders) = load_configurations(self.doc_main_dir)
+        self._configSignature = config_signature(self.doc_main_dir)
         signals_were_blocked = self.store_input.blockSignals(True)
         try:
             self.store_input.clear()
@@ -1343,8 +1388,13 @@ class DIMPackageGUI(QWidget):
                 self.store_input.setCurrentText(selected_store)
         finally:
             self.store_input.blockSignals(signals_were_blocked)
-        self.store_completer = QCompleter(self.storeitems, self)
-        self.store_input.setCompleter(self.store_completer)
+        completer = getattr(self, "store_completer", None)
+        model = completer.model() if completer is not None else None
+        if isinstance(model, QStringListModel):
+            model.setStringList(self.storeitems)
+        else:
+            self.store_completer = QCompleter(self.storeitems, self)
+            self.store_input.setCompleter(self.store_completer)
 
     def toggleAlwaysOnTop(self):
         self.setWindowFlags(self.windowFlags() ^ Qt.WindowType.WindowStaysOnTopHint)
@@ -1490,7 +1540,50 @@ class DIMPackageGUI(QWidget):
         if not self.canMutateWorkspace():
             show_info(self, "Busy", "Please wait for the current operation to finish.")
             return
-        builds_validation = self._validateBuildsForPackaging(builds)
+        builds = list(builds)
+        worker = PackageContentCheckWorker(
+            {build.folder: get_build_content_dir(build.folder) for build in builds},
+            tuple(self.daz_folders),
+            self.support_clean_input.isChecked(),
+            parent=self,
+        )
+        self.packageCheckWorker = worker
+        self._setOperationState(OperationState.PACKAGING)
+        worker.resultReady.connect(
+            lambda checks, builds=builds: self._onPackageContentChecked(
+                builds, checks
+            )
+        )
+        worker.error.connect(self._onPackageContentCheckFailed)
+        worker.finished.connect(
+            lambda worker=worker: self._onPackageCheckWorkerFinished(worker)
+        )
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _onPackageContentChecked(self, builds, content_checks):
+        if self.operation_state is OperationState.CLOSING:
+            return
+        self._setOperationState(OperationState.IDLE)
+        self._reviewAndPackageBuilds(builds, content_checks)
+
+    def _onPackageContentCheckFailed(self, message):
+        if self.operation_state is OperationState.CLOSING:
+            return
+        self._setOperationState(OperationState.IDLE)
+        show_error(self, "Content Check Failed", message)
+
+    def _onPackageCheckWorkerFinished(self, worker):
+        if getattr(self, "packageCheckWorker", None) is worker:
+            self.packageCheckWorker = None
+            if (
+                self.operation_state is OperationState.PACKAGING
+                and getattr(self, "batch_packaging_worker", None) is None
+            ):
+                self._setOperationState(OperationState.IDLE)
+
+    def _reviewAndPackageBuilds(self, builds, content_checks=None):
+        builds_validation = self._validateBuildsForPackaging(builds, content_checks)
         validation_dialog = ValidationDialog(builds_validation, self.session, self)
         dialog_result = validation_dialog.exec()
         result = validation_dialog.getResult()
@@ -1520,8 +1613,9 @@ class DIMPackageGUI(QWidget):
         if not destination_folder:
             return
 
-        self.last_destination_folder = destination_folder
-        settings.setValue("last_destination_folder", self.last_destination_folder)
+        if destination_folder != self.last_destination_folder:
+            self.last_destination_folder = destination_folder
+            settings.setValue("last_destination_folder", destination_folder)
         output_org = settings.value("output_organization", "Flat", type=str)
         if output_org == "By Date":
             destination_errors = []
@@ -1675,7 +1769,7 @@ class DIMPackageGUI(QWidget):
         if self.operation_state is not OperationState.CLOSING:
             self._setOperationState(OperationState.IDLE)
 
-    def _validateBuildsForPackaging(self, builds):
+    def _validateBuildsForPackaging(self, builds, content_checks=None):
         validation_results = []
 
         for build in builds:
@@ -1717,22 +1811,16 @@ class DIMPackageGUI(QWidget):
             if image_path and not os.path.isfile(image_path):
                 issues.append("Cover image is missing or unreadable")
 
-            content_dir = get_build_content_dir(build.folder)
-            content_has_files = False
-            try:
-                inventory = PackageInventory.from_content(
-                    content_dir,
-                    clean_support=self.support_clean_input.isChecked(),
-                )
-                roots = {folder.casefold() for folder in self.daz_folders}
-                content_has_files = any(
-                    len(member.split('/')) >= 3
-                    and member.split('/')[0].casefold() == 'content'
-                    and member.split('/')[1].casefold() in roots
-                    for member in inventory.manifest_members
+            check = (content_checks or {}).get(build.folder)
+            if check is None:
+                check = check_package_content(
+                    get_build_content_dir(build.folder),
+                    self.daz_folders,
+                    self.support_clean_input.isChecked(),
                 )
-            except (OSError, PackagingError, ValueError) as exc:
-                issues.append(str(exc))
+            content_has_files, content_error = check
+            if content_error:
+                issues.append(content_error)
 
             if not content_has_files:
                 issues.append("No packageable file exists below a recognized DAZ folder")
@@ -2243,6 +2331,8 @@ class DIMPackageGUI(QWidget):
 
 if __name__ == '__main__':
     try:
+        import ctypes
+
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("Syst3mApps.DIMCreator")
     except Exception:
         pass
@@ -7,7 +7,7 @@ from session import Build, MAX_BUILDS, SYNCED_BUILD_FIELDS, Session
 from utils import (
     create_build_folder,
     delete_build_folder,
-    has_reparse_point,
+    entry_is_link_or_reparse,
 )
 from logger_utils import get_logger
 
@@ -172,6 +172,27 @@ def reorder_builds(session: Session, new_order: list[str]) -> None:
         build.part = i
 
 
+_IGNORED_CONTENT_NAMES = {'.ds_store', 'thumbs.db', 'desktop.ini'}
+
+
+def _has_content_file(directory: str) -> bool:
+    """Stop at the first real file instead of walking the whole tree."""
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry_is_link_or_reparse(entry):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.casefold() not in _IGNORED_CONTENT_NAMES:
+                        return True
+        except OSError:
+            continue
+    return False
+
+
 def validate_build(build: Build, content_dir: str, daz_folders: list[str], 
                    effective_values: Optional[dict[str, Any]] = None) -> str:
     """Returns 'ready', 'incomplete', or 'empty'."""
@@ -179,24 +200,14 @@ def validate_build(build: Build, content_dir: str, daz_folders: list[str],
     if os.path.exists(content_dir):
         try:
             daz_folders_lower = {folder.casefold() for folder in daz_folders}
-            for item in os.listdir(content_dir):
-                if item.casefold() in daz_folders_lower:
-                    item_path = os.path.join(content_dir, item)
-                    if not os.path.isdir(item_path) or has_reparse_point(item_path):
+            with os.scandir(content_dir) as entries:
+                for entry in entries:
+                    if entry.name.casefold() not in daz_folders_lower:
+                        continue
+                    if entry_is_link_or_reparse(entry) or not entry.is_dir(follow_symlinks=False):
                         continue
-                    for root, dirnames, filenames in os.walk(item_path, followlinks=False):
-                        dirnames[:] = [
-                            name for name in dirnames
-                            if not has_reparse_point(os.path.join(root, name))
-                        ]
-                        if any(
-                            name.casefold() not in {'.ds_store', 'thumbs.db', 'desktop.ini'}
-                            and not has_reparse_point(os.path.join(root, name))
-                            for name in filenames
-                        ):
-                            has_content = True
-                            break
-                    if has_content:
+                    if _has_content_file(entry.path):
+                        has_content = True
                         break
         except OSError as e:
             log.warning("Failed to list contents of '%s' while validating build '%s': %s",
@@ -17,6 +17,7 @@ log = get_logger(__name__)
 CURRENT_CONFIG_VERSION = max(CONFIG_VERSION, 2)
 MAX_CONFIG_BACKUPS = 10
 _UNSUPPORTED_CONTENT_TAGS = frozenset({"plugin", "software"})
+CONFIG_FILENAMES = ("store_data.json", "product_tags.json", "daz_folders.json")
 
 
 class ConfigError(ValueError):
@@ -400,6 +401,20 @@ def update_configuration(
     return merged
 
 
+def config_signature(doc_main_dir: str) -> tuple:
+    """Return a cheap fingerprint that changes when any config file is rewritten."""
+    config_path = Path(doc_main_dir) / "Config"
+    signature = []
+    for filename in CONFIG_FILENAMES:
+        try:
+            info = (config_path / filename).stat()
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((info.st_mtime_ns, info.st_size, info.st_ino))
+    return tuple(signature)
+
+
 def load_configurations(doc_main_dir: str) -> Tuple[List[str], Dict[str, str], List[str], List[str]]:
     config_version = CURRENT_CONFIG_VERSION
     config_path = Path(doc_main_dir) / "Config"
@@ -7,15 +7,18 @@ import re
 import shutil
 import stat
 import subprocess
+import sys
 import tempfile
 import threading
 import time
 import uuid
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import PurePosixPath
-from typing import Any, Callable, Iterable, Sequence
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 from PySide6.QtCore import QThread, Signal
 
@@ -26,6 +29,7 @@ from utils import (
     find_7z_executable,
     find_unrar_executable,
     hidden_subprocess_kwargs,
+    stat_is_link_or_reparse,
 )
 
 
@@ -46,9 +50,35 @@ MAX_EXTERNAL_OUTPUT_CHARS = 256 * 1024**2
 MAX_EXTERNAL_LINE_CHARS = 64 * 1024
 MAX_EXTERNAL_RECORD_FIELDS = 64
 COPY_CHUNK_SIZE = 1024 * 1024
+RAM_SCRATCH_ENV = "DIM_RAMDISK"
+KERNEL_COPY_CHUNK_SIZE = 8 * 1024 * 1024
+STAGE_COPY_WORKERS = max(1, min(8, os.cpu_count() or 1))
+STAGE_COPY_QUEUE_DEPTH = 64
+_KERNEL_COPY_FALLBACK_ERRNOS = frozenset(
+    code
+    for code in (
+        getattr(errno, "EXDEV", None),
+        getattr(errno, "ENOSYS", None),
+        getattr(errno, "EINVAL", None),
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        getattr(errno, "EPERM", None),
+    )
+    if code is not None
+)
+
+# Shared by every extraction so import batches do not pay thread start-up
+# and teardown per archive; threads are only created on first use.
+_IO_POOL = ThreadPoolExecutor(
+    max_workers=STAGE_COPY_WORKERS,
+    thread_name_prefix="dim-io",
+)
 
 _IGNORED_NAMES = {".ds_store", "thumbs.db", "desktop.ini", "__macosx"}
 _INVALID_WINDOWS_CHARS = set('<>"|?*')
+_DRIVE_PREFIX = re.compile(r"^[A-Za-z]:")
+_LINK_ATTRIBUTE = re.compile(r"(?:^|\s)l[rwx-]")
+_BUILD_DIRECTORY_NAME = re.compile(r"Build\d+", re.IGNORECASE)
 _TEMPLATE_WORD = re.compile(r"(?<![A-Za-z0-9])templates?(?![A-Za-z0-9])", re.IGNORECASE)
 
 
@@ -143,10 +173,7 @@ class ArchiveImportPlan:
             paths.append(self.direct_content_root)
         for path in paths:
             candidate = os.path.abspath(path)
-            try:
-                contained = os.path.commonpath((stage_root, candidate)) == stage_root
-            except ValueError:
-                contained = False
+            contained = _is_within_root(stage_root, candidate)
             if not contained or not os.path.exists(candidate) or _is_link_or_reparse(candidate):
                 raise UnsafeArchiveError("Archive import plan contains an unsafe staged path.")
 
@@ -328,6 +355,34 @@ def _ordered_parts(
     return [path for _, _, path in sorted(matches, key=lambda item: item[0])]
 
 
+_MULTIPART_PATTERNS = (
+    (
+        "XofY pattern",
+        re.compile(r"_(\d+)of(\d+)(?=\D|$)", re.IGNORECASE),
+        True,
+    ),
+    (
+        "Part pattern",
+        re.compile(
+            r"(?:^|[^A-Za-z0-9])part\s*(\d+)"
+            r"(?:\s*(?:of|-)\s*(\d+))?(?=\D|$)",
+            re.IGNORECASE,
+        ),
+        True,
+    ),
+    (
+        "build-number pattern",
+        re.compile(r"(?<!\d)(\d{1,2})_\d{5,}\.(?:zip|rar|7z)$", re.IGNORECASE),
+        False,
+    ),
+    (
+        "trailing-number pattern",
+        re.compile(r"(?<!\d)_(\d{1,2})\.(?:zip|rar|7z)$", re.IGNORECASE),
+        False,
+    ),
+)
+
+
 def detect_heuristic_ordering(archive_files):
     """Order multipart archives and reject duplicate or incomplete sequences."""
     archive_files = list(archive_files)
@@ -336,34 +391,8 @@ def detect_heuristic_ordering(archive_files):
     if len(archive_files) > 99:
         raise MultipartArchiveError("A DIM package can contain at most 99 parts.")
 
-    patterns = (
-        (
-            "XofY pattern",
-            re.compile(r"_(\d+)of(\d+)(?=\D|$)", re.IGNORECASE),
-            True,
-        ),
-        (
-            "Part pattern",
-            re.compile(
-                r"(?:^|[^A-Za-z0-9])part\s*(\d+)"
-                r"(?:\s*(?:of|-)\s*(\d+))?(?=\D|$)",
-                re.IGNORECASE,
-            ),
-            True,
-        ),
-        (
-            "build-number pattern",
-            re.compile(r"(?<!\d)(\d{1,2})_\d{5,}\.(?:zip|rar|7z)$", re.IGNORECASE),
-            False,
-        ),
-        (
-            "trailing-number pattern",
-            re.compile(r"(?<!\d)_(\d{1,2})\.(?:zip|rar|7z)$", re.IGNORECASE),
-            False,
-        ),
-    )
 
-    for pattern_name, pattern, supports_total in patterns:
+    for pattern_name, pattern, supports_total in _MULTIPART_PATTERNS:
         matches = []
         for archive_path in archive_files:
             match = pattern.search(os.path.basename(archive_path))
@@ -393,7 +422,7 @@ def _normalise_member_path(raw_path: str) -> str:
         raise UnsafeArchiveError("Archive contains an empty or invalid path.")
 
     path = raw_path.replace("\\", "/")
-    if path.startswith("/") or path.startswith("//") or re.match(r"^[A-Za-z]:", path):
+    if path.startswith("/") or path.startswith("//") or _DRIVE_PREFIX.match(path):
         raise UnsafeArchiveError(f"Archive contains an absolute path: {raw_path}")
 
     parts = []
@@ -514,20 +543,58 @@ def _validate_inventory(
     )
 
 
-def _stat_is_link_or_reparse(info: os.stat_result) -> bool:
-    if stat.S_ISLNK(info.st_mode):
-        return True
-    attributes = getattr(info, "st_file_attributes", 0)
-    reparse_flag = getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400)
-    return bool(attributes & reparse_flag)
-
-
 def _is_link_or_reparse(path: str) -> bool:
     try:
         info = os.lstat(path)
     except OSError:
         return False
-    return _stat_is_link_or_reparse(info)
+    return stat_is_link_or_reparse(info)
+
+
+def _walk_entries(
+    root: str,
+    cancel_check: Callable[[], bool] | None = None,
+    *,
+    skip_directory: Callable[[str], bool] | None = None,
+) -> Iterator[tuple[os.DirEntry, str, os.stat_result]]:
+    """Yield non-directory entries below root with their relative POSIX path.
+
+    Links and reparse points are yielded instead of followed so callers can
+    reject them; the stat comes from the directory listing where the platform
+    provides it.
+    """
+    pending = [(root, "")]
+    while pending:
+        _check_cancelled(cancel_check)
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                children = list(iterator)
+        except OSError as exc:
+            raise ExtractionError(f"Cannot read directory {directory}: {exc}") from exc
+        subdirectories = []
+        for child in children:
+            _check_cancelled(cancel_check)
+            relative = prefix + child.name
+            try:
+                info = child.stat(follow_symlinks=False)
+            except OSError as exc:
+                raise ExtractionError(f"Cannot inspect {child.path}: {exc}") from exc
+            if stat.S_ISDIR(info.st_mode) and not stat_is_link_or_reparse(info):
+                if skip_directory is None or not skip_directory(child.name):
+                    subdirectories.append((child.path, relative + "/"))
+                continue
+            yield child, relative, info
+        pending.extend(reversed(subdirectories))
+
+
+def _is_within_root(root_abs: str, candidate_abs: str) -> bool:
+    """Prefix containment check for two already-absolute paths."""
+    root_key = os.path.normcase(root_abs)
+    candidate_key = os.path.normcase(candidate_abs)
+    return candidate_key == root_key or candidate_key.startswith(
+        os.path.join(root_key, "")
+    )
 
 
 def _safe_destination(root: str, relative_path: str) -> str:
@@ -536,11 +603,7 @@ def _safe_destination(root: str, relative_path: str) -> str:
     destination = os.path.abspath(
         os.path.join(root_abs, *relative_path.split("/"))
     )
-    try:
-        contained = os.path.commonpath((root_abs, destination)) == root_abs
-    except ValueError:
-        contained = False
-    if not contained:
+    if not _is_within_root(root_abs, destination):
         raise UnsafeArchiveError(f"Path escapes extraction root: {relative_path}")
     return destination
 
@@ -559,6 +622,63 @@ def _ensure_free_space(path: str, required_bytes: int) -> None:
         )
 
 
+def _scratch_candidates() -> list[str]:
+    """Return the writable RAM-backed directories that may hold scratch space."""
+    candidates = []
+    override = os.environ.get(RAM_SCRATCH_ENV, "").strip()
+    if override:
+        candidates.append(override)
+    if sys.platform.startswith("linux"):
+        candidates.append("/dev/shm")
+    return [
+        candidate
+        for candidate in candidates
+        if os.path.isabs(candidate)
+        and os.path.isdir(candidate)
+        and not _is_link_or_reparse(candidate)
+        and os.access(candidate, os.W_OK | os.X_OK)
+    ]
+
+
+def _scratch_parent(required_bytes: int | None) -> str | None:
+    """Return a RAM-backed directory for scratch space when it has room to spare."""
+    if required_bytes is None:
+        return None
+    for candidate in _scratch_candidates():
+        try:
+            free = shutil.disk_usage(candidate).free
+        except OSError:
+            continue
+        if free - required_bytes >= MIN_FREE_SPACE_BYTES:
+            return candidate
+    return None
+
+
+def _scratch_bytes(
+    archive_paths: Iterable[str],
+    cancel_check: Callable[[], bool],
+) -> int | None:
+    """Return the scratch space extracting these archives needs, from their inventories.
+
+    Each archive is extracted and its content staged once more, so the
+    uncompressed total is counted twice. ``None`` means the size is unknown,
+    or no RAM disk is available, and the system temporary directory should
+    be used; archives are only listed when a RAM disk could take them.
+    """
+    if not _scratch_candidates():
+        return None
+    required = 0
+    for archive_path in archive_paths:
+        try:
+            inventory = inspect_archive(archive_path, cancel_check=cancel_check)
+        except ExtractionCancelled:
+            raise
+        except (ExtractionError, OSError):
+            return None
+        required += 2 * inventory.total_uncompressed
+    return required
+
+
 def _volume_key(path: str) -> tuple[str, int | str]:
     """Return a stable key for aggregating planned writes on one volume."""
     probe = os.path.abspath(path)
@@ -575,6 +695,22 @@ def _volume_key(path: str) -> tuple[str, int | str]:
     return ("device", device) if device else ("drive", drive or probe.casefold())
 
 
+def _kernel_copy_function() -> Callable[[int, int, int], int] | None:
+    """Return an in-kernel fd-to-fd copy primitive for this platform, if any."""
+    if hasattr(os, "copy_file_range"):
+        return lambda source_fd, destination_fd, count: os.copy_file_range(
+            source_fd, destination_fd, count
+        )
+    if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+        return lambda source_fd, destination_fd, count: os.sendfile(
+            destination_fd, source_fd, None, count
+        )
+    return None
+
+
+_kernel_copy = _kernel_copy_function()
+
+
 def _copy_file(
     source: str,
     destination: str,
@@ -599,7 +735,7 @@ def _copy_file(
         )
     if (
         not stat.S_ISREG(source_before.st_mode)
-        or _stat_is_link_or_reparse(source_before)
+        or stat_is_link_or_reparse(source_before)
     ):
         raise UnsafeArchiveError("Copy source must be a regular file.")
 
@@ -621,7 +757,7 @@ def _copy_file(
         opened_stat = os.fstat(source_fd)
         if (
             not stat.S_ISREG(opened_stat.st_mode)
-            or _stat_is_link_or_reparse(opened_stat)
+            or stat_is_link_or_reparse(opened_stat)
         ):
             raise UnsafeArchiveError("Copy source must be a regular file.")
         if identity(opened_stat) != identity(source_before):
@@ -629,15 +765,39 @@ def _copy_file(
                 "Source file changed while being opened."
             )
 
-        os.makedirs(os.path.dirname(destination), exist_ok=True)
         copied_bytes = 0
         with os.fdopen(source_fd, "rb") as src:
             source_fd = -1
             with open(destination, "xb") as dst:
                 destination_created = True
+                kernel_copy = _kernel_copy
                 while True:
                     if cancel_check():
                         raise ExtractionCancelled("Extraction cancelled.")
+                    if kernel_copy is not None:
+                        try:
+                            copied = kernel_copy(
+                                src.fileno(), dst.fileno(), KERNEL_COPY_CHUNK_SIZE
+                            )
+                        except OSError as exc:
+                            if (
+                                copied_bytes
+                                or exc.errno not in _KERNEL_COPY_FALLBACK_ERRNOS
+                            ):
+                                raise
+                            kernel_copy = None
+                            continue
+                        if not copied:
+                            if copied_bytes >= source_before.st_size:
+                                break
+                            # Some filesystems report 0 instead of an errno
+                            # when they cannot copy in-kernel; finish buffered.
+                            kernel_copy = None
+                            src.seek(copied_bytes)
+                            dst.seek(copied_bytes)
+                            continue
+                        copied_bytes += copied
+                        continue
                     chunk = src.read(COPY_CHUNK_SIZE)
                     if not chunk:
                         break
@@ -798,6 +958,8 @@ def _run_external(
 
 
 class _ZipAdapter:
+    supports_member_selection = True
+
     def __init__(
         self,
         archive_path: str,
@@ -859,17 +1021,25 @@ class _ZipAdapter:
             raise ExtractionError("ZIP archive was not inventoried before extraction.")
         os.makedirs(destination, exist_ok=True)
         inventory_by_key = {member.path.casefold(): member for member in inventory.members}
+        created_directories = {os.path.abspath(destination)}
 
         for info in self._infos:
             if cancel_check():
                 raise ExtractionCancelled("Extraction cancelled.")
             normalised = _normalise_member_path(info.filename)
-            member = inventory_by_key[normalised.casefold()]
+            member = inventory_by_key.get(normalised.casefold())
+            if member is None:
+                continue
             target = _safe_destination(destination, normalised)
             if member.is_dir:
-                os.makedirs(target, exist_ok=True)
+                if target not in created_directories:
+                    os.makedirs(target, exist_ok=True)
+                    created_directories.add(target)
                 continue
-            os.makedirs(os.path.dirname(target), exist_ok=True)
+            parent = os.path.dirname(target)
+            if parent not in created_directories:
+                os.makedirs(parent, exist_ok=True)
+                created_directories.add(parent)
             if os.path.lexists(target):
                 raise UnsafeArchiveError(f"Archive member would overwrite another member: {normalised}")
             copied = 0
@@ -1002,6 +1172,8 @@ def _integer(record: dict[str, str], *keys: str) -> int:
 
 
 class _ExternalAdapter:
+    supports_member_selection = False
+
     def __init__(
         self,
         archive_path: str,
@@ -1077,7 +1249,7 @@ class _ExternalAdapter:
             ):
                 raise UnsafeArchiveError(f"Archive contains a link: {path}")
             attributes = record.get("Attributes", "")
-            if "REPARSE" in attributes.upper() or re.search(r"(?:^|\s)l[rwx-]", attributes):
+            if "REPARSE" in attributes.upper() or _LINK_ATTRIBUTE.search(attributes):
                 raise UnsafeArchiveError(f"Archive contains a link or reparse point: {path}")
             is_dir = record.get("Folder", "-") == "+" or attributes.upper().startswith("D")
             members.append(
@@ -1206,26 +1378,16 @@ def _validate_extracted_tree(
     actual = {}
     root_abs = os.path.abspath(root)
 
-    for current, directories, files in os.walk(root_abs, topdown=True, followlinks=False):
-        _check_cancelled(cancel_check)
-        for name in list(directories):
-            _check_cancelled(cancel_check)
-            path = os.path.join(current, name)
-            if _is_link_or_reparse(path):
-                raise UnsafeArchiveError(f"Extractor created a link or reparse point: {name}")
-        for name in files:
-            _check_cancelled(cancel_check)
-            path = os.path.join(current, name)
-            if _is_link_or_reparse(path):
-                raise UnsafeArchiveError(f"Extractor created a link or reparse point: {name}")
-            relative = os.path.relpath(path, root_abs).replace(os.sep, "/")
-            normalised = _normalise_member_path(relative)
-            key = normalised.casefold()
-            if key in actual:
-                raise UnsafeArchiveError(
-                    f"Extractor created a case-insensitive collision: {normalised}"
-                )
-            actual[key] = (normalised, os.path.getsize(path))
+    for entry, relative, info in _walk_entries(root_abs, cancel_check):
+        if stat_is_link_or_reparse(info):
+            raise UnsafeArchiveError(f"Extractor created a link or reparse point: {entry.name}")
+        normalised = _normalise_member_path(relative)
+        key = normalised.casefold()
+        if key in actual:
+            raise UnsafeArchiveError(
+                f"Extractor created a case-insensitive collision: {normalised}"
+            )
+        actual[key] = (normalised, info.st_size)
 
     if set(actual) != set(expected):
         missing = sorted(set(expected) - set(actual))[:5]
@@ -1259,9 +1421,13 @@ class _ExtractionBudget:
             raise UnsafeArchiveError("Import contains more than 100 embedded archives.")
 
 
-def inspect_archive(archive_path: str) -> ArchiveInventory:
+def inspect_archive(
+    archive_path: str,
+    *,
+    cancel_check: Callable[[], bool] | None = None,
+) -> ArchiveInventory:
     """Return a validated inventory without extracting the archive."""
-    cancel_check = lambda: False
+    cancel_check = cancel_check or (lambda: False)
     with _open_adapter(archive_path, cancel_check) as adapter:
         return adapter.inventory()
 
@@ -1272,8 +1438,13 @@ def extract_archive_safely(
     *,
     cancel_check: Callable[[], bool] | None = None,
     budget: _ExtractionBudget | None = None,
+    member_filter: Callable[[str], bool] | None = None,
 ) -> ArchiveInventory:
-    """Inventory and extract one archive exactly once into an empty directory."""
+    """Inventory and extract one archive exactly once into an empty directory.
+
+    Adapters with random member access only write the file members accepted
+    by ``member_filter``; the budget still covers the whole archive.
+    """
     cancel_check = cancel_check or (lambda: False)
     if cancel_check():
         raise ExtractionCancelled("Extraction cancelled.")
@@ -1289,14 +1460,45 @@ def extract_archive_safely(
         inventory = adapter.inventory()
         if budget is not None:
             budget.add(inventory)
-        _ensure_free_space(destination, inventory.total_uncompressed)
-        adapter.extract(destination, inventory, cancel_check)
+        selected = inventory
+        if member_filter is not None and adapter.supports_member_selection:
+            selected = _select_members(inventory, member_filter)
+        _ensure_free_space(destination, selected.total_uncompressed)
+        adapter.extract(destination, selected, cancel_check)
         return inventory
 
 
+def _select_members(
+    inventory: ArchiveInventory,
+    member_filter: Callable[[str], bool],
+) -> ArchiveInventory:
+    members = tuple(
+        member
+        for member in inventory.members
+        if not member.is_dir and member_filter(member.path)
+    )
+    return ArchiveInventory(
+        inventory.archive_path,
+        members,
+        sum(member.size for member in members),
+        inventory.embedded_archives,
+    )
+
+
+def _is_relevant_member(path: str, daz_folders: set[str]) -> bool:
+    """Whether _scan_extracted_tree could use this member at all."""
+    folded = path.casefold().split("/")
+    if any(part in _IGNORED_NAMES for part in folded):
+        return False
+    if len(folded) == 1 and folded[0] in daz_folders:
+        return True
+    return any(part in daz_folders for part in folded[:-1]) or _is_archive_name(path)
+
+
 @dataclass
 class _TreeAnalysis:
     content_files: list[tuple[str, str]] = field(default_factory=list)
+    content_bytes: int = 0
     embedded_archives: list[str] = field(default_factory=list)
     template_archives: list[str] = field(default_factory=list)
 
@@ -1310,73 +1512,104 @@ def _scan_extracted_tree(
     output_paths = {}
     root_abs = os.path.abspath(root)
 
-    for current, directories, files in os.walk(root_abs, topdown=True, followlinks=False):
-        _check_cancelled(cancel_check)
-        retained_directories = []
-        for name in list(directories):
-            _check_cancelled(cancel_check)
-            path = os.path.join(current, name)
-            if _is_link_or_reparse(path):
-                raise UnsafeArchiveError(f"Extracted tree contains a link or reparse point: {path}")
-            if name.casefold() not in _IGNORED_NAMES:
-                retained_directories.append(name)
-        directories[:] = retained_directories
-        for name in files:
-            _check_cancelled(cancel_check)
-            source = os.path.join(current, name)
-            if _is_link_or_reparse(source):
-                raise UnsafeArchiveError(f"Extracted tree contains a link or reparse point: {source}")
-            relative = os.path.relpath(source, root_abs).replace(os.sep, "/")
-            normalised = _normalise_member_path(relative)
-            parts = normalised.split("/")
-            if any(part.casefold() in _IGNORED_NAMES for part in parts):
-                continue
-            if len(parts) == 1 and parts[0].casefold() in daz_folders:
+    for entry, relative, info in _walk_entries(
+        root_abs,
+        cancel_check,
+        skip_directory=lambda name: name.casefold() in _IGNORED_NAMES,
+    ):
+        source = entry.path
+        if stat_is_link_or_reparse(info):
+            raise UnsafeArchiveError(f"Extracted tree contains a link or reparse point: {source}")
+        normalised = _normalise_member_path(relative)
+        parts = normalised.split("/")
+        if any(part.casefold() in _IGNORED_NAMES for part in parts):
+            continue
+        if len(parts) == 1 and parts[0].casefold() in daz_folders:
+            raise UnsafeArchiveError(
+                f"DAZ root must be a directory, not a file: {normalised}"
+            )
+        root_index = next(
+            (
+                index
+                for index, part in enumerate(parts[:-1])
+                if part.casefold() in daz_folders
+            ),
+            None,
+        )
+        if root_index is not None:
+            output_relative = "/".join(parts[root_index:])
+            key = output_relative.casefold()
+            previous = output_paths.get(key)
+            if previous is not None:
                 raise UnsafeArchiveError(
-                    f"DAZ root must be a directory, not a file: {normalised}"
+                    f"DAZ content contains a case-insensitive collision: {previous} / {output_relative}"
                 )
-            root_index = next(
-                (
-                    index
-                    for index, part in enumerate(parts[:-1])
-                    if part.casefold() in daz_folders
-                ),
-                None,
-            )
-            if root_index is not None:
-                output_relative = "/".join(parts[root_index:])
-                key = output_relative.casefold()
-                previous = output_paths.get(key)
-                if previous is not None:
-                    raise UnsafeArchiveError(
-                        f"DAZ content contains a case-insensitive collision: {previous} / {output_relative}"
-                    )
-                output_paths[key] = output_relative
-                analysis.content_files.append((source, output_relative))
-            elif _is_archive_name(normalised):
-                if is_template_archive(normalised):
-                    analysis.template_archives.append(source)
-                else:
-                    analysis.embedded_archives.append(source)
+            output_paths[key] = output_relative
+            analysis.content_files.append((source, output_relative))
+            analysis.content_bytes += info.st_size
+        elif _is_archive_name(normalised):
+            if is_template_archive(normalised):
+                analysis.template_archives.append(source)
+            else:
+                analysis.embedded_archives.append(source)
 
     return analysis
 
 
+def _copy_batch(
+    batch: Sequence[tuple[str, str]],
+    cancel_check: Callable[[], bool],
+) -> None:
+    for source, target in batch:
+        _copy_file(source, target, cancel_check)
+
+
 def _stage_content(
     analysis: _TreeAnalysis,
     destination: str,
     cancel_check: Callable[[], bool],
 ) -> None:
-    required = sum(os.path.getsize(source) for source, _ in analysis.content_files)
-    _ensure_free_space(destination, required)
+    # The walk already lstat'ed every file, so no per-file getsize is needed.
+    _ensure_free_space(destination, analysis.content_bytes)
     os.makedirs(destination, exist_ok=True)
-    for source, relative in analysis.content_files:
-        if cancel_check():
-            raise ExtractionCancelled("Extraction cancelled.")
-        target = _safe_destination(destination, relative)
-        if os.path.lexists(target):
-            raise UnsafeArchiveError(f"Content collision while staging: {relative}")
-        _copy_file(source, target, cancel_check)
+    targets = [
+        _safe_destination(destination, relative)
+        for _, relative in analysis.content_files
+    ]
+    # Parents sort before their children, so each directory is one mkdir.
+    for directory in sorted({os.path.dirname(target) for target in targets}, key=len):
+        os.makedirs(directory, exist_ok=True)
+    # Copies are submitted in batches so thousands of small files do not each
+    # pay for a future and a trip through the executor's work queue.
+    batch_size = max(1, len(targets) // (STAGE_COPY_WORKERS * 4))
+    pending: deque[Future] = deque()
+    batch: list[tuple[str, str]] = []
+
+    def submit_batch() -> None:
+        pending.append(_IO_POOL.submit(_copy_batch, tuple(batch), cancel_check))
+        batch.clear()
+        while len(pending) >= STAGE_COPY_QUEUE_DEPTH:
+            pending.popleft().result()
+
+    try:
+        for (source, relative), target in zip(analysis.content_files, targets):
+            if cancel_check():
+                raise ExtractionCancelled("Extraction cancelled.")
+            if os.path.lexists(target):
+                raise UnsafeArchiveError(f"Content collision while staging: {relative}")
+            batch.append((source, target))
+            if len(batch) >= batch_size:
+                submit_batch()
+        if batch:
+            submit_batch()
+        while pending:
+            pending.popleft().result()
+    finally:
+        # Never return while a pooled copy may still be writing into the
+        # destination that the caller is about to roll back.
+        for future in pending:
+            future.cancel()
+        wait(pending)
 
 
 def _validate_template_source(template_path: str) -> str:
@@ -1417,11 +1650,13 @@ def _prepare_archive(
             cancel_check,
         )
     outer_root = os.path.join(work_root, "outer")
+    relevant = lambda path: _is_relevant_member(path, daz_folders)
     extract_archive_safely(
         source_archive,
         outer_root,
         cancel_check=cancel_check,
         budget=budget,
+        member_filter=relevant,
     )
     analysis = _scan_extracted_tree(outer_root, daz_folders, cancel_check)
     content_root = os.path.join(work_root, "content")
@@ -1446,6 +1681,7 @@ def _prepare_archive(
             nested_root,
             cancel_check=cancel_check,
             budget=budget,
+            member_filter=relevant,
         )
         nested_analysis = _scan_extracted_tree(
             nested_root, daz_folders, cancel_check
@@ -1494,7 +1730,7 @@ def _content_containment_root(content_dir: str) -> str:
     build_root = os.path.dirname(content_root)
     if (
         os.path.basename(content_root).casefold() == "content"
-        and re.fullmatch(r"Build\d+", os.path.basename(build_root), re.IGNORECASE)
+        and _BUILD_DIRECTORY_NAME.fullmatch(os.path.basename(build_root))
     ):
         return os.path.dirname(build_root)
     return content_root
@@ -1550,24 +1786,17 @@ class _FileTransaction:
         *,
         containment_root: str | None = None,
     ) -> None:
-        for current, directories, files in os.walk(source_root, topdown=True, followlinks=False):
-            _check_cancelled(cancel_check)
-            for name in directories:
-                _check_cancelled(cancel_check)
-                if _is_link_or_reparse(os.path.join(current, name)):
-                    raise UnsafeArchiveError("Staged content contains a link or reparse point.")
-            for name in files:
-                _check_cancelled(cancel_check)
-                source = os.path.join(current, name)
-                relative = os.path.relpath(source, source_root).replace(os.sep, "/")
-                self.entries.append(
-                    _TransactionEntry(
-                        source,
-                        target_root,
-                        relative,
-                        containment_root,
-                    )
+        for entry, relative, info in _walk_entries(source_root, cancel_check):
+            if stat_is_link_or_reparse(info) and entry.is_dir():
+                raise UnsafeArchiveError("Staged content contains a link or reparse point.")
+            self.entries.append(
+                _TransactionEntry(
+                    entry.path,
+                    target_root,
+                    relative,
+                    containment_root,
                 )
+            )
 
     def add_file(
         self,
@@ -2058,15 +2287,37 @@ def plan_archive_import(
             os.path.join(stage_root, "source_archive"),
             cancel_check,
         )
+        # Size the RAM disk from the snapshot's inventory, plus the snapshot
+        # itself, which is copied there before extraction.
+        required = _scratch_bytes((source_snapshot,), cancel_check)
+        if required is not None:
+            required += os.path.getsize(source_snapshot)
+        scratch_parent = _scratch_parent(required)
+        if scratch_parent is not None:
+            scratch_root = tempfile.mkdtemp(
+                prefix="dim_import_plan_", dir=scratch_parent
+            )
+            try:
+                source_snapshot = _snapshot_archive(
+                    source_snapshot,
+                    os.path.join(scratch_root, "source_archive"),
+                    cancel_check,
+                )
+            except BaseException:
+                shutil.rmtree(scratch_root, ignore_errors=True)
+                raise
+            shutil.rmtree(stage_root, ignore_errors=True)
+            stage_root = scratch_root
         outer_root = os.path.join(stage_root, "outer")
         budget = _ExtractionBudget()
+        folders = {str(folder).casefold() for folder in daz_folders}
         extract_archive_safely(
             source_snapshot,
             outer_root,
             cancel_check=cancel_check,
             budget=budget,
+            member_filter=lambda path: _is_relevant_member(path, folders),
         )
-        folders = {str(folder).casefold() for folder in daz_folders}
         analysis = _scan_extracted_tree(outer_root, folders, cancel_check)
         direct_content_root = None
         warning = None
@@ -2452,7 +2703,12 @@ class MultiBuildExtractionWorker(QThread):
             targets, next_number = self._allocate_builds()
             budget = self.import_plan.initial_budget()
 
-            with tempfile.TemporaryDirectory(prefix="dim_multi_extract_") as work_root:
+            scratch_bytes = _scratch_bytes(
+                (target.archive_path for target in targets), self._cancelled
+            )
+            with tempfile.TemporaryDirectory(
+                prefix="dim_multi_extract_", dir=_scratch_parent(scratch_bytes)
+            ) as work_root:
                 template_targets = []
                 for index, target in enumerate(targets, 1):
                     if self._cancelled():
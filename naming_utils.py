@@ -8,17 +8,29 @@ DIM_ZIP_FILENAME_PATTERN = re.compile(
     r"(?P<sku>[0-9]{8})-(?P<part>[0-9]{2})_"
     r"(?P<name>[A-Za-z0-9]+)\.zip$"
 )
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+_UNSAFE_SEGMENT_RE = re.compile(r"[^A-Za-z0-9_-]+")
+_SKU_DIGITS_RE = re.compile(r"[0-9]{1,8}")
+_PART_DIGITS_RE = re.compile(r"[0-9]{1,2}")
+
+
+def _strip_non_alnum(value: str) -> str:
+    if value.isascii() and value.isalnum():
+        return value
+    return _NON_ALNUM_RE.sub("", value)
 
 
 def sanitize_dim_zip_product_name(product_name: str, fallback: str = "Package") -> str:
-    sanitized = re.sub(r"[^A-Za-z0-9]+", "", str(product_name))
-    fallback_sanitized = re.sub(r"[^A-Za-z0-9]+", "", str(fallback))
-    return sanitized or fallback_sanitized or "Package"
+    return (
+        _strip_non_alnum(str(product_name))
+        or _strip_non_alnum(str(fallback))
+        or "Package"
+    )
 
 
 def sanitize_support_filename_segment(value: str, fallback: str = "") -> str:
-    sanitized = re.sub(r"[^A-Za-z0-9_-]+", "_", str(value)).strip("_")
-    fallback_sanitized = re.sub(r"[^A-Za-z0-9_-]+", "_", str(fallback)).strip("_")
+    sanitized = _UNSAFE_SEGMENT_RE.sub("_", str(value)).strip("_")
+    fallback_sanitized = _UNSAFE_SEGMENT_RE.sub("_", str(fallback)).strip("_")
     return sanitized or fallback_sanitized
 
 
@@ -40,7 +52,7 @@ def validate_dim_prefix(prefix: str, fallback: str | None = None) -> str:
 
 def validate_dim_sku(sku: str | int) -> int:
     value = str(sku).strip()
-    if not re.fullmatch(r"[0-9]{1,8}", value):
+    if not _SKU_DIGITS_RE.fullmatch(value):
         raise ValueError("DIM SKU must contain 1-8 digits.")
     numeric = int(value)
     if not 1 <= numeric <= 99_999_999:
@@ -52,7 +64,7 @@ def validate_dim_part(product_part: str | int) -> int:
     if isinstance(product_part, bool):
         raise ValueError("DIM package part must be between 1 and 99.")
     value = str(product_part).strip()
-    if not re.fullmatch(r"[0-9]{1,2}", value):
+    if not _PART_DIGITS_RE.fullmatch(value):
         raise ValueError("DIM package part must contain 1-2 digits.")
     numeric = int(value)
     if not 1 <= numeric <= 99:
@@ -11,14 +11,15 @@ import threading
 import time
 import uuid
 import zipfile
+import zlib
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path, PurePosixPath
-from typing import Callable, Iterable, Optional
-from xml.dom import minidom
+from typing import Callable, Iterable, Optional, Sequence
 from xml.etree import ElementTree
-from xml.etree.ElementTree import Element, SubElement, tostring
+from xml.etree.ElementTree import Element, SubElement
 
 from PIL import Image, ImageOps
 from PySide6.QtCore import QThread, Signal
@@ -40,21 +41,110 @@ log = get_logger(__name__)
 SEVEN_ZIP_TOTAL_TIMEOUT_SECONDS = 4 * 60 * 60
 SEVEN_ZIP_PROGRESS_TIMEOUT_SECONDS = 5 * 60
 COPY_CHUNK_SIZE = 1024 * 1024
+ZIP_WRITE_BUFFER_SIZE = 1024 * 1024
+# Level 9 costs two to three times the CPU of level 6 for typically under
+# 1% smaller packages, so "balanced" (6) is the default.
+COMPRESSION_PROFILE_LEVELS = {"fast": 1, "balanced": 6, "small": 9}
+DEFAULT_COMPRESSION_PROFILE = "balanced"
+PRECOMPRESSED_EXTENSIONS = frozenset(
+    {
+        ".jpg", ".jpeg", ".png", ".webp",
+        ".gz", ".zip", ".7z", ".rar", ".bz2", ".xz", ".mp3", ".mp4", ".ogg",
+    }
+)
+# DAZ Studio saves these either gzipped or as plain JSON; only the gzipped
+# ones are stored.
+GZIP_OPTIONAL_EXTENSIONS = frozenset({".duf", ".dsf"})
+GZIP_MAGIC = b"\x1f\x8b"
+STORE_ONLY_PRECOMPRESSED_RATIO = 0.8
+PARALLEL_DEFLATE_MAX_BYTES = 4 * 1024 * 1024
+ZIP_DEFLATE_WORKERS = max(1, min(8, os.cpu_count() or 1))
+SEVEN_ZIP_THREADS = max(1, os.cpu_count() or 1)
 MAX_COVER_BYTES = 20 * 1024 * 1024
 MAX_COVER_PIXELS = 40_000_000
 SYSTEM_NAMES = {".ds_store", "thumbs.db", "desktop.ini", "__macosx"}
 BUILD_DIRECTORY_NAME = re.compile(r"Build\d+", re.IGNORECASE)
+SEVEN_ZIP_LINE_BREAK = re.compile(rb"[\r\n]+")
+SEVEN_ZIP_PERCENT = re.compile(rb"(\d{1,3})\s*%")
 INTERNAL_ARTIFACT_NAME = re.compile(
     r"^(?:\.dimcreator-|\..+\.dim-(?:backup|new)-[0-9a-f]{32}$)",
     re.IGNORECASE,
 )
 
 
-def prettify(elem: Element) -> str:
-    rough_string = tostring(elem, "utf-8")
-    reparsed = minidom.parseString(rough_string)
-    pretty = reparsed.toprettyxml(indent="  ")
-    return "\n".join(pretty.split("\n")[1:])
+def _xml_attribute(value: str) -> str:
+    # Same escaping ElementTree applies to attribute values.
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("\r", "&#13;")
+        .replace("\n", "&#10;")
+        .replace("\t", "&#09;")
+    )
+
+
+_READ_NOFOLLOW_FLAGS = (
+    os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NOFOLLOW", 0)
+)
+
+
+def _is_precompressed(archive_path: str, head: bytes | None = None) -> bool:
+    """Return whether a member is already compressed.
+
+    Without ``head`` (the member's first bytes), gzip-optional formats are
+    assumed to be plain text.
+    """
+    suffix = os.path.splitext(archive_path)[1].lower()
+    if suffix in GZIP_OPTIONAL_EXTENSIONS:
+        return head is not None and head[:2] == GZIP_MAGIC
+    return suffix in PRECOMPRESSED_EXTENSIONS
+
+
+def _deflate_member(
+    entry: PackageInventoryEntry,
+    compression: int,
+    level: int,
+    store_precompressed: bool = False,
+) -> tuple[zipfile.ZipInfo, bytes]:
+    descriptor = os.open(entry.source_path, _READ_NOFOLLOW_FLAGS)
+    with os.fdopen(descriptor, "rb") as source:
+        data = source.read(PARALLEL_DEFLATE_MAX_BYTES + 1)
+    if len(data) != entry.size:
+        raise OSError(f"file size changed while packaging ({len(data)} != {entry.size})")
+    if store_precompressed and _is_precompressed(entry.archive_path, data):
+        compression = zipfile.ZIP_STORED
+    if compression == zipfile.ZIP_STORED:
+        compressed = data
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        compressed = compressor.compress(data) + compressor.flush()
+    info = zipfile.ZipInfo(entry.archive_path)
+    info.compress_type = compression
+    info.external_attr = 0o600 << 16
+    info.file_size = len(data)
+    info.compress_size = len(compressed)
+    info.CRC = zlib.crc32(data)
+    return info, compressed
+
+
+def _write_precompressed(
+    archive: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    compressed: bytes,
+) -> None:
+    # Mirrors ZipFile.open(..., "w") for a member whose sizes and CRC are
+    # already known, so no data descriptor or header rewrite is needed.
+    archive._writecheck(info)
+    archive._didModify = True
+    archive.fp.seek(archive.start_dir)
+    info.header_offset = archive.fp.tell()
+    archive.fp.write(info.FileHeader(False))
+    archive.fp.write(compressed)
+    archive.start_dir = archive.fp.tell()
+    archive.filelist.append(info)
+    archive.NameToInfo[info.filename] = info
 
 
 class PackageStatus(str, Enum):
@@ -114,9 +204,18 @@ class PackageInventory:
     ) -> PackageInventory:
         combined = [*self.entries, *additional_entries]
         seen: dict[str, str] = {}
+        directories: dict[str, str] = {}
         for entry in combined:
             key = entry.archive_path.casefold()
-            previous = seen.get(key)
+            previous = seen.get(key) or directories.get(key)
+            if previous is None:
+                parent, _, _ = entry.archive_path.rpartition("/")
+                while parent:
+                    known = directories.setdefault(parent.casefold(), parent)
+                    if known != parent or parent.casefold() in seen:
+                        previous = seen.get(parent.casefold(), known)
+                        break
+                    parent, _, _ = parent.rpartition("/")
             if previous is not None:
                 raise PackagingError(
                     "Package inventory contains a case-insensitive name collision: "
@@ -159,6 +258,7 @@ class PackageSpec:
     destination_folder: str
     recognized_content_roots: Optional[tuple[str, ...]] = None
     replace_existing: bool = False
+    compression_profile: str = DEFAULT_COMPRESSION_PROFILE
 
 
 class PackagingError(RuntimeError):
@@ -292,6 +392,21 @@ def _inventory_entries(
     return tuple(entries)
 
 
+def _directory_casing(
+    inventory: PackageInventory,
+    parts: Sequence[str],
+) -> list[str]:
+    """Return the spelling the inventory already uses for nested directories."""
+    resolved = list(parts)
+    for entry in inventory.entries:
+        segments = entry.archive_path.split("/")[:-1]
+        for index, expected in enumerate(parts):
+            if index >= len(segments) or segments[index].casefold() != expected.casefold():
+                break
+            resolved[index] = segments[index]
+    return resolved
+
+
 def _is_within(path: Path, parent: Path) -> bool:
     try:
         return os.path.commonpath((str(path), str(parent))) == str(parent)
@@ -356,6 +471,30 @@ def validate_package_destination(
     return str(destination)
 
 
+def check_package_content(
+    content_dir: str | os.PathLike,
+    recognized_content_roots: Iterable[str],
+    clean_support: bool = False,
+) -> tuple[bool, Optional[str]]:
+    """Return whether a file sits below a recognized DAZ root, and any inventory error."""
+    try:
+        inventory = PackageInventory.from_content(
+            content_dir, clean_support=clean_support
+        )
+    except (OSError, PackagingError, ValueError) as exc:
+        return False, str(exc)
+    roots = {folder.casefold() for folder in recognized_content_roots}
+    for member in inventory.manifest_members:
+        parts = member.split("/", 2)
+        if (
+            len(parts) == 3
+            and parts[0].casefold() == "content"
+            and parts[1].casefold() in roots
+        ):
+            return True, None
+    return False, None
+
+
 def validate_package_spec(
     spec: PackageSpec,
     recognized_content_roots: Optional[Iterable[str]] = None,
@@ -372,6 +511,7 @@ class PackagingPipeline:
         self._is_cancelled: Callable[[], bool] = lambda: False
         self._normalized_guid = ""
         self._cover_bytes: bytes | None = None
+        self._cover_name = ""
         if self.seven_zip_path:
             self.log.info("7-Zip executable found at: %s", self.seven_zip_path)
         else:
@@ -384,8 +524,13 @@ class PackagingPipeline:
         is_cancelled: Callable[[], bool] | None = None,
     ) -> PackageResult:
         progress_callback = progress or (lambda _percent, _stage: None)
+        last_reported = None
 
         def report_progress(percent: int, stage: str) -> None:
+            nonlocal last_reported
+            if (percent, stage) == last_reported:
+                return
+            last_reported = (percent, stage)
             try:
                 progress_callback(percent, stage)
             except Exception as exc:
@@ -414,16 +559,24 @@ class PackagingPipeline:
                 staging_content.mkdir(parents=True)
 
                 report_progress(5, "Staging")
-                self._copy_to_staging(source_inventory, staging_root, report_progress)
+                content_inventory = self._copy_to_staging(
+                    source_inventory,
+                    staging_root,
+                    report_progress,
+                )
 
                 report_progress(12, "Processing Image")
-                self._process_image(staging_content)
+                cover_entry = self._process_image(staging_content, content_inventory)
                 self._check_cancelled()
-
-                content_inventory = PackageInventory.from_content(
-                    staging_content,
-                    cancel_check=self._is_cancelled,
-                )
+                if cover_entry is not None:
+                    cover_key = cover_entry.archive_path.casefold()
+                    content_inventory = PackageInventory(
+                        tuple(
+                            entry
+                            for entry in content_inventory.entries
+                            if entry.archive_path.casefold() != cover_key
+                        )
+                    ).with_entries((cover_entry,))
                 report_progress(16, "Creating Manifest")
                 self._create_manifest(staging_root, content_inventory)
                 report_progress(19, "Creating Supplement")
@@ -438,10 +591,24 @@ class PackagingPipeline:
                     scaled_percent = 20 + int((percent / 100) * 75)
                     report_progress(scaled_percent, "Packaging")
 
+                compression, level = self._zip_compression(inventory)
                 if self.seven_zip_path:
-                    self._zip_with_7z(temp_zip, staging_root, inventory, report_zip_progress)
+                    self._zip_with_7z(
+                        temp_zip,
+                        staging_root,
+                        inventory,
+                        report_zip_progress,
+                        compression,
+                        level,
+                    )
                 else:
-                    self._zip_with_zipfile(temp_zip, inventory, report_zip_progress)
+                    self._zip_with_zipfile(
+                        temp_zip,
+                        inventory,
+                        report_zip_progress,
+                        compression,
+                        level,
+                    )
 
                 report_progress(96, "Verifying")
                 self._verify_archive(temp_zip, final_path.name, inventory)
@@ -534,6 +701,10 @@ class PackagingPipeline:
             raise PackagingError("Clean Support must be a boolean value.")
         if not isinstance(self.spec.replace_existing, bool):
             raise PackagingError("Replace Existing must be a boolean value.")
+        if self.spec.compression_profile not in COMPRESSION_PROFILE_LEVELS:
+            raise PackagingError(
+                f"Unknown compression profile: {self.spec.compression_profile!r}"
+            )
         content_only_tags = {
             tag.strip().casefold()
             for tag in self.spec.product_tags.split(",")
@@ -552,6 +723,7 @@ class PackagingPipeline:
         )
 
         self._cover_bytes = None
+        self._cover_name = ""
         if self.spec.image_path:
             try:
                 image_input = Path(self.spec.image_path)
@@ -604,7 +776,7 @@ class PackagingPipeline:
             except Exception as exc:
                 raise PackagingError(f"Cover image is invalid: {exc}") from exc
             try:
-                build_support_cover_filename(
+                self._cover_name = build_support_cover_filename(
                     self.spec.store,
                     self.spec.sku,
                     self.spec.product_name,
@@ -669,13 +841,18 @@ class PackagingPipeline:
         inventory: PackageInventory,
         staging_root: Path,
         progress_callback: Callable[[int, str], None],
-    ) -> None:
+    ) -> PackageInventory:
         copied = 0
         total = max(1, inventory.total_size)
+        last_percent = -1
+        staged: list[PackageInventoryEntry] = []
+        created_directories: set[Path] = set()
         for entry in inventory.entries:
             self._check_cancelled()
             target = staging_root.joinpath(*PurePosixPath(entry.archive_path).parts)
-            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.parent not in created_directories:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                created_directories.add(target.parent)
             source = Path(entry.source_path)
             try:
                 source_stat = source.lstat()
@@ -703,51 +880,89 @@ class PackagingPipeline:
                         )
                     ):
                         raise PackagingError(f"Package content changed while staging: {source}")
+                    file_copied = 0
                     while True:
                         self._check_cancelled()
                         chunk = source_file.read(COPY_CHUNK_SIZE)
                         if not chunk:
                             break
                         target_file.write(chunk)
+                        file_copied += len(chunk)
                         copied += len(chunk)
-                        progress_callback(5 + int((copied / total) * 5), "Staging")
+                        percent = 5 + (copied * 5) // total
+                        if percent != last_percent:
+                            progress_callback(percent, "Staging")
+                            last_percent = percent
             except OSError as exc:
                 raise PackagingError(f"Cannot stage package content {source}: {exc}") from exc
+            if file_copied != entry.size:
+                raise PackagingError(f"Package content changed while staging: {source}")
+            # The staged tree is private to this run, so it is inventoried from
+            # the copy loop instead of being walked a second time.
+            staged.append(
+                PackageInventoryEntry(
+                    source_path=str(target),
+                    archive_path=entry.archive_path,
+                    size=entry.size,
+                )
+            )
+        return PackageInventory(tuple(staged))
 
-    def _process_image(self, staging_content: Path) -> None:
+    def _process_image(
+        self,
+        staging_content: Path,
+        inventory: PackageInventory,
+    ) -> Optional[PackageInventoryEntry]:
         if not self.spec.image_path:
-            return
-        if self._cover_bytes is None:
+            return None
+        if self._cover_bytes is None or not self._cover_name:
             raise PackagingError("Cover image was not validated before packaging.")
         self._check_cancelled()
-        image_name = build_support_cover_filename(
-            self.spec.store,
-            self.spec.sku,
-            self.spec.product_name,
+        image_name = self._cover_name
+        _, runtime_name, support_name = _directory_casing(
+            inventory, ("Content", "Runtime", "Support")
         )
-        target_dir = staging_content / "Runtime" / "Support"
+        target_dir = staging_content / runtime_name / support_name
         target_dir.mkdir(parents=True, exist_ok=True)
         target_path = target_dir / image_name
         try:
             with Image.open(io.BytesIO(self._cover_bytes)) as image:
+                if image.format == "JPEG":
+                    # Let libjpeg decode at a reduced DCT scale, keeping twice the
+                    # thumbnail size so LANCZOS still has samples to work with.
+                    image.draft("RGB", (600, 600))
                 image = ImageOps.exif_transpose(image)
                 if image.mode != "RGB":
                     image = image.convert("RGB")
                 image.thumbnail((300, 300), Image.Resampling.LANCZOS)
                 image.save(target_path, "JPEG")
+            size = target_path.stat().st_size
         except Exception as exc:
             raise PackagingError(f"Image processing failed: {exc}") from exc
+        return PackageInventoryEntry(
+            source_path=str(target_path),
+            archive_path=f"Content/{runtime_name}/{support_name}/{image_name}",
+            size=size,
+        )
 
     def _create_manifest(
         self,
         staging_root: Path,
         inventory: PackageInventory,
     ) -> None:
-        root = Element("DAZInstallManifest", VERSION="0.1")
-        SubElement(root, "GlobalID", VALUE=self._normalized_guid)
-        for member in inventory.manifest_members:
-            SubElement(root, "File", TARGET="Content", ACTION="Install", VALUE=member)
-        self._write_xml(staging_root / "Manifest.dsx", root)
+        # Written line by line in the two-space indented layout _write_xml()
+        # produces; large packages list thousands of files and a DOM
+        # round-trip buys nothing.
+        with open(
+            staging_root / "Manifest.dsx", "w", encoding="utf-8", newline="\n"
+        ) as output:
+            output.write('<DAZInstallManifest VERSION="0.1">\n')
+            output.write(f'  <GlobalID VALUE="{_xml_attribute(self._normalized_guid)}" />\n')
+            output.writelines(
+                f'  <File TARGET="Content" ACTION="Install" VALUE="{_xml_attribute(member)}" />\n'
+                for member in inventory.manifest_members
+            )
+            output.write("</DAZInstallManifest>\n")
 
     def _create_supplement(self, staging_root: Path) -> None:
         root = Element("ProductSupplement", VERSION="0.1")
@@ -765,8 +980,11 @@ class PackagingPipeline:
 
     @staticmethod
     def _write_xml(path: Path, root: Element) -> None:
-        with open(path, "w", encoding="utf-8", newline="\n") as output:
-            output.write(prettify(root))
+        # Two-space indented, serialized straight into the file.
+        ElementTree.indent(root, space="  ")
+        with open(path, "wb") as output:
+            ElementTree.ElementTree(root).write(output, encoding="utf-8")
+            output.write(b"\n")
 
     @staticmethod
     def _metadata_inventory_entries(
@@ -799,43 +1017,124 @@ class PackagingPipeline:
             self.spec.product_name,
         )
 
+    def _zip_compression(self, inventory: PackageInventory) -> tuple[int, int]:
+        profile = self.spec.compression_profile
+        level = COMPRESSION_PROFILE_LEVELS[profile]
+        if profile == "small":
+            return zipfile.ZIP_DEFLATED, level
+        precompressed = sum(
+            entry.size
+            for entry in inventory.entries
+            if _is_precompressed(entry.archive_path)
+        )
+        if precompressed > inventory.total_size * STORE_ONLY_PRECOMPRESSED_RATIO:
+            self.log.info("Package content is mostly precompressed; storing members.")
+            return zipfile.ZIP_STORED, 0
+        return zipfile.ZIP_DEFLATED, level
+
     def _zip_with_zipfile(
         self,
         zip_path: Path,
         inventory: PackageInventory,
         progress_callback: Callable[[int], None],
+        compression: int = zipfile.ZIP_DEFLATED,
+        level: int = COMPRESSION_PROFILE_LEVELS[DEFAULT_COMPRESSION_PROFILE],
     ) -> None:
         written = 0
         total = max(1, inventory.total_size)
-        with zipfile.ZipFile(
-            zip_path,
-            mode="x",
-            compression=zipfile.ZIP_DEFLATED,
-            compresslevel=6,
-            strict_timestamps=False,
-        ) as archive:
-            for entry in inventory.entries:
-                self._check_cancelled()
+        last_percent = -1
+        pending: deque[tuple[PackageInventoryEntry, Future]] = deque()
+        # Deflating textures and archives costs CPU for almost no gain, so
+        # they are stored individually unless the profile asks for "small".
+        store_precompressed = (
+            compression == zipfile.ZIP_DEFLATED
+            and self.spec.compression_profile != "small"
+        )
+
+        def report(amount: int) -> None:
+            # Thousands of small members would otherwise repeat the same
+            # integer percent once each.
+            nonlocal written, last_percent
+            written += amount
+            percent = min(99, (written * 100) // total)
+            if percent != last_percent:
+                progress_callback(percent)
+                last_percent = percent
+
+        def drain(limit: int) -> None:
+            while len(pending) > limit:
+                entry, future = pending.popleft()
                 try:
-                    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NOFOLLOW", 0)
-                    descriptor = os.open(entry.source_path, flags)
-                    with os.fdopen(descriptor, "rb") as source, archive.open(
-                        entry.archive_path,
-                        mode="w",
-                        force_zip64=entry.size >= zipfile.ZIP64_LIMIT,
-                    ) as target:
-                        while True:
-                            self._check_cancelled()
-                            chunk = source.read(COPY_CHUNK_SIZE)
-                            if not chunk:
-                                break
-                            target.write(chunk)
-                            written += len(chunk)
-                            progress_callback(min(99, int((written / total) * 100)))
+                    info, data = future.result()
                 except OSError as exc:
                     raise PackagingError(
                         f"Cannot add package member {entry.archive_path!r}: {exc}"
                     ) from exc
+                self._check_cancelled()
+                _write_precompressed(archive, info, data)
+                report(entry.size)
+
+        # Small members are deflated on worker threads (zlib releases the GIL)
+        # and written in inventory order; large ones stream in bounded chunks.
+        executor = ThreadPoolExecutor(max_workers=ZIP_DEFLATE_WORKERS)
+        try:
+            with (
+                open(zip_path, "xb", buffering=ZIP_WRITE_BUFFER_SIZE) as output,
+                zipfile.ZipFile(
+                    output,
+                    mode="w",
+                    compression=compression,
+                    compresslevel=level if compression == zipfile.ZIP_DEFLATED else None,
+                    strict_timestamps=False,
+                ) as archive,
+            ):
+                for entry in inventory.entries:
+                    self._check_cancelled()
+                    if entry.size <= PARALLEL_DEFLATE_MAX_BYTES:
+                        pending.append(
+                            (
+                                entry,
+                                executor.submit(
+                                    _deflate_member,
+                                    entry,
+                                    compression,
+                                    level,
+                                    store_precompressed,
+                                ),
+                            )
+                        )
+                        drain(ZIP_DEFLATE_WORKERS * 2)
+                        continue
+                    drain(0)
+                    try:
+                        descriptor = os.open(entry.source_path, _READ_NOFOLLOW_FLAGS)
+                        with os.fdopen(descriptor, "rb") as source:
+                            member: str | zipfile.ZipInfo = entry.archive_path
+                            if store_precompressed and _is_precompressed(
+                                entry.archive_path, source.peek(len(GZIP_MAGIC))
+                            ):
+                                member = zipfile.ZipInfo(entry.archive_path)
+                                member.compress_type = zipfile.ZIP_STORED
+                                member.external_attr = 0o600 << 16
+                            with archive.open(
+                                member,
+                                mode="w",
+                                force_zip64=entry.size >= zipfile.ZIP64_LIMIT,
+                            ) as target:
+                                while True:
+                                    self._check_cancelled()
+                                    chunk = source.read(COPY_CHUNK_SIZE)
+                                    if not chunk:
+                                        break
+                                    target.write(chunk)
+                                    report(len(chunk))
+                    except OSError as exc:
+                        raise PackagingError(
+                            f"Cannot add package member {entry.archive_path!r}: {exc}"
+                        ) from exc
+                drain(0)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
         progress_callback(100)
 
     def _zip_with_7z(
@@ -844,14 +1143,21 @@ class PackagingPipeline:
         staging_root: Path,
         inventory: PackageInventory,
         progress_callback: Callable[[int], None],
+        compression: int = zipfile.ZIP_DEFLATED,
+        level: int = COMPRESSION_PROFILE_LEVELS[DEFAULT_COMPRESSION_PROFILE],
     ) -> None:
+        method = "Deflate"
+        if compression == zipfile.ZIP_STORED:
+            method, level = "Copy", 0
         list_path = zip_path.with_suffix(".files.txt")
         list_path.write_text("\n".join(inventory.archive_members), encoding="utf-8")
         command = [
             str(self.seven_zip_path),
             "a",
             "-tzip",
-            "-mx=6",
+            f"-mm={method}",
+            f"-mx={level}",
+            f"-mmt={SEVEN_ZIP_THREADS}",
             "-bsp1",
             "-bso1",
             "-bse1",
@@ -882,9 +1188,10 @@ class PackagingPipeline:
         reader = threading.Thread(target=read_output, daemon=True)
         reader.start()
         started = last_progress = time.monotonic()
-        output_tail: deque[str] = deque(maxlen=40)
+        # Output stays as bytes; only the failure tail is ever decoded.
+        output_tail: deque[bytes] = deque(maxlen=40)
         reader_finished = False
-        progress_buffer = ""
+        progress_buffer = b""
         last_percent = -1
 
         try:
@@ -903,10 +1210,9 @@ class PackagingPipeline:
                     reader_finished = True
                     continue
                 last_progress = now
-                text = chunk.decode("utf-8", errors="replace")
-                output_tail.extend(part for part in re.split(r"[\r\n]+", text) if part)
-                progress_buffer = (progress_buffer + text)[-512:]
-                matches = list(re.finditer(r"(\d{1,3})\s*%", progress_buffer))
+                output_tail.extend(part for part in SEVEN_ZIP_LINE_BREAK.split(chunk) if part)
+                progress_buffer = (progress_buffer + chunk)[-512:]
+                matches = list(SEVEN_ZIP_PERCENT.finditer(progress_buffer))
                 if matches:
                     percent = max(0, min(100, int(matches[-1].group(1))))
                     if percent > last_percent:
@@ -916,7 +1222,10 @@ class PackagingPipeline:
 
             return_code = process.wait()
             if return_code != 0:
-                details = "\n".join(output_tail).strip() or "No diagnostic output."
+                details = (
+                    b"\n".join(output_tail).decode("utf-8", errors="replace").strip()
+                    or "No diagnostic output."
+                )
                 raise PackagingError(f"7-Zip failed with code {return_code}: {details}")
             progress_callback(100)
         except BaseException:
@@ -1162,3 +1471,38 @@ class BatchPackagingWorker(QThread):
             "skipped": sum(1 for result in results if result.get("skipped", False)),
         }
         self.allCompleted.emit(summary)
+
+
+class PackageContentCheckWorker(QThread):
+    resultReady = Signal(object)
+    error = Signal(str)
+
+    def __init__(
+        self,
+        content_dirs: dict[str, str],
+        recognized_content_roots: Iterable[str],
+        clean_support: bool,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.content_dirs = dict(content_dirs)
+        self.recognized_content_roots = tuple(recognized_content_roots)
+        self.clean_support = clean_support
+
+    def requestCancellation(self) -> None:
+        self.requestInterruption()
+
+    def run(self) -> None:
+        try:
+            checks = {}
+            for key, content_dir in self.content_dirs.items():
+                if self.isInterruptionRequested():
+                    return
+                checks[key] = check_package_content(
+                    content_dir, self.recognized_content_roots, self.clean_support
+                )
+        except Exception as exc:
+            log.exception("Package content check failed")
+            self.error.emit(str(exc) or exc.__class__.__name__)
+            return
+        self.resultReady.emit(checks)
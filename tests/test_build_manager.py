@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import build_manager
+import utils
 from build_manager import (
     create_build,
     delete_build,
@@ -135,6 +136,50 @@ class BuildValidationTests(unittest.TestCase):
             (runtime / "Thumbs.db").write_bytes(b"system")
             self.assertEqual(validate_build(build, temp_dir, ["Runtime"]), "empty")
 
+    def test_nested_file_counts_as_content_but_linked_file_does_not(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            nested = Path(temp_dir) / "Runtime" / "Textures" / "Set"
+            nested.mkdir(parents=True)
+            outside = Path(temp_dir) / "outside.png"
+            outside.write_bytes(b"png")
+            try:
+                (nested / "linked.png").symlink_to(outside)
+            except (OSError, NotImplementedError):
+                self.skipTest("Symlinks are unavailable.")
+            self.assertFalse(build_manager._has_content_file(str(nested.parent.parent)))
+
+            (nested / "real.png").write_bytes(b"png")
+            self.assertTrue(build_manager._has_content_file(str(nested.parent.parent)))
+
+    def test_linked_recognized_root_is_not_content(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            content = Path(temp_dir) / "Content"
+            content.mkdir()
+            outside = Path(temp_dir) / "outside"
+            outside.mkdir()
+            (outside / "content.duf").write_text("content", encoding="utf-8")
+            try:
+                (content / "Runtime").symlink_to(outside, target_is_directory=True)
+            except (OSError, NotImplementedError):
+                self.skipTest("Symlinks are unavailable.")
+            build = make_build(1, 1)
+            self.assertEqual(validate_build(build, str(content), ["Runtime"]), "empty")
+
+    def test_reparse_directories_are_not_descended_into(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            junction = Path(temp_dir) / "Runtime" / "junction"
+            junction.mkdir(parents=True)
+            (junction / "outside.png").write_bytes(b"png")
+            build = make_build(1, 1)
+            real_check = utils.entry_is_link_or_reparse
+
+            with patch.object(
+                build_manager,
+                "entry_is_link_or_reparse",
+                side_effect=lambda entry: entry.name == "junction" or real_check(entry),
+            ):
+                self.assertEqual(validate_build(build, temp_dir, ["Runtime"]), "empty")
+
     def test_valid_content_requires_official_metadata_values(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             runtime = Path(temp_dir) / "Runtime"
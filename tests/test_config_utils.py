@@ -10,6 +10,7 @@ from config_utils import (
     ConfigError,
     UnsupportedConfigVersionError,
     atomic_write_json,
+    config_signature,
     load_configurations,
     normalize_store_items,
     normalize_tag_items,
@@ -250,6 +251,20 @@ class ConfigurationPersistenceTests(unittest.TestCase):
                 atomic_write_json(path, {"version": 2, "data": [number]})
             self.assertEqual(len(list((path.parent / "backups").glob("*.json"))), 10)
 
+    def test_config_signature_tracks_config_rewrites(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertEqual(config_signature(temp_dir), (None, None, None))
+            load_configurations(temp_dir)
+            loaded = config_signature(temp_dir)
+
+            self.assertNotIn(None, loaded)
+            self.assertEqual(config_signature(temp_dir), loaded)
+            path = Path(temp_dir) / "Config" / "store_data.json"
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload["data"].append({"name": "Extra Store", "prefix": "EX"})
+            atomic_write_json(path, payload)
+            self.assertNotEqual(config_signature(temp_dir), loaded)
+
     def test_atomic_writer_refuses_to_downgrade_future_config(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             path = Path(temp_dir) / "settings.json"
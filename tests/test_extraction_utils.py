@@ -1,3 +1,4 @@
+import errno
 import io
 import os
 import stat
@@ -207,6 +208,200 @@ class SafeArchiveInventoryTests(unittest.TestCase):
                     destination, inventory, cancel_after_member_starts
                 )
 
+    def test_prefix_containment_rejects_sibling_with_shared_prefix(self):
+        root = os.path.join(self.temp.name, "root")
+        self.assertTrue(extraction._is_within_root(root, root))
+        self.assertTrue(
+            extraction._is_within_root(root, os.path.join(root, "People", "a.duf"))
+        )
+        self.assertFalse(extraction._is_within_root(root, root + "-sibling"))
+        self.assertFalse(extraction._is_within_root(root, self.temp.name))
+
+    def test_zip_extraction_writes_only_relevant_members(self):
+        archive = os.path.join(self.temp.name, "product.zip")
+        _write_zip(
+            archive,
+            {
+                "Readme.txt": b"readme",
+                "Promo/large.jpg": b"j" * 4096,
+                "Wrapper/People/a.duf": b"a",
+                "Wrapper/__MACOSX/People/._a.duf": b"x",
+                "Templates/template.zip": b"zip",
+            },
+        )
+        destination = os.path.join(self.temp.name, "outer")
+
+        inventory = extraction.extract_archive_safely(
+            archive,
+            destination,
+            member_filter=lambda path: extraction._is_relevant_member(path, {"people"}),
+        )
+
+        extracted = sorted(
+            os.path.relpath(os.path.join(current, name), destination).replace(os.sep, "/")
+            for current, _, files in os.walk(destination)
+            for name in files
+        )
+        self.assertEqual(extracted, ["Templates/template.zip", "Wrapper/People/a.duf"])
+        self.assertEqual(len([m for m in inventory.members if not m.is_dir]), 5)
+
+    def test_tree_scan_prunes_ignored_folders_and_rejects_links(self):
+        root = os.path.join(self.temp.name, "tree")
+        for relative in (
+            "Wrapper/People/a.duf",
+            "Wrapper/__MACOSX/People/._a.duf",
+            "extra.zip",
+        ):
+            path = os.path.join(root, *relative.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as output:
+                output.write(b"x")
+
+        analysis = extraction._scan_extracted_tree(root, {"people"})
+
+        self.assertEqual(
+            [relative for _, relative in analysis.content_files],
+            ["People/a.duf"],
+        )
+        self.assertEqual(analysis.content_bytes, 1)
+        self.assertEqual(
+            analysis.embedded_archives, [os.path.join(root, "extra.zip")]
+        )
+        try:
+            os.symlink(
+                os.path.join(root, "Wrapper"),
+                os.path.join(root, "linked"),
+                target_is_directory=True,
+            )
+        except (OSError, NotImplementedError):
+            self.skipTest("Symlinks are unavailable.")
+        with self.assertRaisesRegex(extraction.UnsafeArchiveError, "link or reparse"):
+            extraction._scan_extracted_tree(root, {"people"})
+
+    def test_staging_copies_content_in_batches_through_a_bounded_window(self):
+        source_root = os.path.join(self.temp.name, "extracted")
+        os.makedirs(source_root)
+        analysis = extraction._TreeAnalysis()
+        for index in range(12):
+            source = os.path.join(source_root, f"file{index}.duf")
+            with open(source, "wb") as output:
+                output.write(str(index).encode())
+            analysis.content_files.append((source, f"People/Set{index % 3}/file{index}.duf"))
+        destination = os.path.join(self.temp.name, "staged")
+
+        with (
+            mock.patch.object(extraction, "_ensure_free_space"),
+            mock.patch.object(extraction, "STAGE_COPY_QUEUE_DEPTH", 2),
+            mock.patch.object(extraction, "STAGE_COPY_WORKERS", 1),
+            mock.patch.object(
+                extraction, "_copy_batch", wraps=extraction._copy_batch
+            ) as copy_batch,
+        ):
+            extraction._stage_content(analysis, destination, lambda: False)
+
+        self.assertEqual(copy_batch.call_count, 4)
+
+        for index in range(12):
+            path = os.path.join(destination, "People", f"Set{index % 3}", f"file{index}.duf")
+            with open(path, "rb") as staged:
+                self.assertEqual(staged.read(), str(index).encode())
+
+    def test_scratch_parent_requires_room_on_the_ram_disk(self):
+        usage = mock.Mock(free=extraction.MIN_FREE_SPACE_BYTES + 4 * 1024)
+        with (
+            mock.patch.dict(os.environ, {extraction.RAM_SCRATCH_ENV: self.temp.name}),
+            mock.patch.object(extraction.sys, "platform", "win32"),
+            mock.patch.object(extraction.shutil, "disk_usage", return_value=usage),
+        ):
+            self.assertEqual(extraction._scratch_parent(4096), self.temp.name)
+            self.assertIsNone(extraction._scratch_parent(4097))
+            self.assertIsNone(extraction._scratch_parent(None))
+        with (
+            mock.patch.dict(os.environ, {extraction.RAM_SCRATCH_ENV: "relative"}),
+            mock.patch.object(extraction.sys, "platform", "win32"),
+        ):
+            self.assertIsNone(extraction._scratch_parent(0))
+
+    def test_scratch_size_comes_from_the_uncompressed_inventory(self):
+        archive = os.path.join(self.temp.name, "compressible.zip")
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as output:
+            output.writestr("People/a.duf", b"\0" * 300_000)
+            output.writestr("People/b.duf", b"\0" * 100_000)
+        self.assertLess(os.path.getsize(archive), 10_000)
+
+        broken = os.path.join(self.temp.name, "broken.zip")
+        with open(broken, "wb") as output:
+            output.write(b"not a zip")
+
+        with mock.patch.object(
+            extraction, "_scratch_candidates", return_value=[self.temp.name]
+        ):
+            self.assertEqual(
+                extraction._scratch_bytes([archive], lambda: False), 800_000
+            )
+            self.assertIsNone(
+                extraction._scratch_bytes([archive, broken], lambda: False)
+            )
+            with self.assertRaises(extraction.ExtractionCancelled):
+                extraction._scratch_bytes([archive], lambda: True)
+
+    def test_scratch_size_skips_the_inventory_without_a_ram_disk(self):
+        with (
+            mock.patch.object(extraction, "_scratch_candidates", return_value=[]),
+            mock.patch.object(extraction, "inspect_archive") as inspect,
+        ):
+            self.assertIsNone(
+                extraction._scratch_bytes(["archive.7z"], lambda: False)
+            )
+        inspect.assert_not_called()
+
+    def test_copy_falls_back_when_kernel_copy_is_unsupported(self):
+        source = os.path.join(self.temp.name, "source.bin")
+        payload = os.urandom(3 * extraction.COPY_CHUNK_SIZE + 17)
+        with open(source, "wb") as output:
+            output.write(payload)
+
+        def unsupported(_source_fd, _destination_fd, _count):
+            raise OSError(errno.EXDEV, "cross-device")
+
+        for name, kernel_copy in (
+            ("default", extraction._kernel_copy),
+            ("fallback", unsupported),
+        ):
+            with self.subTest(name=name), mock.patch.object(
+                extraction, "_kernel_copy", kernel_copy
+            ):
+                destination = os.path.join(self.temp.name, f"{name}.bin")
+                extraction._copy_file(source, destination, lambda: False)
+                with open(destination, "rb") as copied:
+                    self.assertEqual(copied.read(), payload)
+
+    def test_copy_falls_back_when_kernel_copy_returns_zero_early(self):
+        source = os.path.join(self.temp.name, "source.bin")
+        payload = os.urandom(3 * extraction.COPY_CHUNK_SIZE + 17)
+        with open(source, "wb") as output:
+            output.write(payload)
+        calls = []
+
+        def stalls_after_first_chunk(source_fd, destination_fd, count):
+            calls.append(count)
+            if len(calls) > 1:
+                return 0
+            data = os.read(source_fd, 1000)
+            return os.write(destination_fd, data)
+
+        for name, kernel_copy in (
+            ("immediate", lambda _source_fd, _destination_fd, _count: 0),
+            ("partial", stalls_after_first_chunk),
+        ):
+            with self.subTest(name=name), mock.patch.object(
+                extraction, "_kernel_copy", kernel_copy
+            ):
+                destination = os.path.join(self.temp.name, f"{name}.bin")
+                extraction._copy_file(source, destination, lambda: False)
+                with open(destination, "rb") as copied:
+                    self.assertEqual(copied.read(), payload)
+
     def test_copy_rejects_source_replaced_during_secure_open(self):
         source = os.path.join(self.temp.name, "source.zip")
         replacement = os.path.join(self.temp.name, "replacement.zip")
@@ -794,6 +989,30 @@ class ArchivePlanningWorkerTests(unittest.TestCase):
         self.space_patch.start()
         self.addCleanup(self.space_patch.stop)
 
+    def test_ram_stage_is_sized_from_the_snapshot(self):
+        archive = os.path.join(self.temp.name, "product.zip")
+        _write_zip(archive, {"Runtime/file.txt": b"content"})
+        ram_disk = os.path.join(self.temp.name, "ramdisk")
+        os.makedirs(ram_disk)
+        real_inspect = extraction.inspect_archive
+        inspected = []
+
+        def recording_inspect(path, **kwargs):
+            inspected.append(os.path.abspath(path))
+            return real_inspect(path, **kwargs)
+
+        with (
+            mock.patch.object(extraction, "_scratch_candidates", return_value=[ram_disk]),
+            mock.patch.object(extraction, "inspect_archive", side_effect=recording_inspect),
+        ):
+            plan = extraction.plan_archive_import(archive, {"Runtime"}, True)
+        self.addCleanup(plan.cleanup)
+
+        self.assertEqual(os.path.dirname(plan.stage_root), ram_disk)
+        self.assertEqual(len(inspected), 1)
+        self.assertNotEqual(inspected[0], os.path.abspath(archive))
+        self.assertFalse(os.path.exists(os.path.dirname(os.path.dirname(inspected[0]))))
+
     def test_direct_plan_is_committed_without_extracting_outer_again(self):
         template = _zip_bytes({"readme.txt": b"template"})
         archive = os.path.join(self.temp.name, "product.zip")
@@ -1735,7 +1954,8 @@ class TransactionRollbackTests(unittest.TestCase):
             output.write(b"12345")
         destination = os.path.join(self.temp.name, "stage")
         analysis = extraction._TreeAnalysis(
-            content_files=[(source, "Runtime/source.bin")]
+            content_files=[(source, "Runtime/source.bin")],
+            content_bytes=5,
         )
 
         with mock.patch.object(extraction, "_ensure_free_space") as check:
@@ -43,6 +43,9 @@ class NamingUtilsTests(unittest.TestCase):
             sanitize_dim_zip_product_name("X Fashion - Series_3 for G8-8.1 Females"),
             "XFashionSeries3forG881Females",
         )
+        self.assertEqual(sanitize_dim_zip_product_name("Café²Ruins"), "CafRuins")
+        self.assertEqual(sanitize_dim_zip_product_name("TempleRuins2"), "TempleRuins2")
+        self.assertEqual(sanitize_dim_zip_product_name("---", "Ü"), "Package")
 
     def test_dim_zip_filename_pads_sku_and_part(self):
         self.assertEqual(
@@ -85,7 +88,7 @@ class NamingUtilsTests(unittest.TestCase):
         self.assertEqual(validate_dim_sku("1"), 1)
         self.assertEqual(validate_dim_sku("99999999"), 99_999_999)
         self.assertEqual(format_dim_sku("1"), "00000001")
-        for invalid in ("", "0", "00000000", "100000000", "-1", "1.5", "abc"):
+        for invalid in ("", "0", "00000000", "100000000", "-1", "1.5", "abc", "１２"):
             with self.subTest(invalid=invalid):
                 with self.assertRaises(ValueError):
                     validate_dim_sku(invalid)
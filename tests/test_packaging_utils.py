@@ -1,3 +1,4 @@
+import gzip
 import os
 import tempfile
 import unittest
@@ -20,6 +21,7 @@ from packaging_utils import (
     PackageStatus,
     PackagingError,
     PackagingPipeline,
+    check_package_content,
     find_7z_executable,
     validate_package_spec,
 )
@@ -141,6 +143,24 @@ class PackageInventoryTests(PackagingTestCase):
             with self.assertRaisesRegex(PackagingError, "name collision"):
                 PackageInventory.from_content(self.content_dir)
 
+    def test_added_entries_reject_case_insensitive_directory_collisions(self):
+        self._write("Runtime/Support/old.dsx", b"old")
+        inventory = PackageInventory.from_content(self.content_dir)
+
+        for archive_path in (
+            "Content/runtime/Support/cover.jpg",
+            "Content/Runtime/Support/old.dsx/cover.jpg",
+            "Content/Runtime",
+        ):
+            extra = packaging_utils.PackageInventoryEntry(
+                source_path=str(self.root / "cover.jpg"),
+                archive_path=archive_path,
+                size=1,
+            )
+            with self.subTest(archive_path=archive_path):
+                with self.assertRaisesRegex(PackagingError, "name collision"):
+                    inventory.with_entries((extra,))
+
     def test_inventory_rejects_windows_device_names(self):
         self._write("People/CON.duf", b"unsafe")
         with self.assertRaisesRegex(PackagingError, "reserved Windows name"):
@@ -189,7 +209,9 @@ class PackagingPipelineTests(PackagingTestCase):
         inventory = SimpleNamespace(archive_members=("Content/People/file.duf",))
 
         with (
-            mock.patch.object(packaging_utils.subprocess, "Popen", return_value=Process()),
+            mock.patch.object(
+                packaging_utils.subprocess, "Popen", return_value=Process()
+            ) as popen,
             mock.patch.object(packaging_utils.queue, "Queue", return_value=OutputQueue()),
             mock.patch.object(packaging_utils.threading, "Thread", ReaderThread),
             mock.patch.object(
@@ -210,6 +232,51 @@ class PackagingPipelineTests(PackagingTestCase):
 
         self.assertEqual(progress, [10, 100])
         self.assertEqual(events, ["join", "close"])
+        self.assertIn(
+            f"-mmt={packaging_utils.SEVEN_ZIP_THREADS}", popen.call_args.args[0]
+        )
+        self.assertIn("-mm=Deflate", popen.call_args.args[0])
+
+    def test_7zip_carriage_return_progress_and_failure_tail_are_parsed_as_bytes(self):
+        class Process:
+            stdout = SimpleNamespace(close=lambda: None)
+
+            def __init__(self):
+                self._polls = iter((None, None, 2))
+
+            def poll(self):
+                return next(self._polls, 2)
+
+            def wait(self):
+                return 2
+
+        output = iter((b"  5%\r 12%\r", " 40%\rERROR: déjà full\n".encode(), None))
+        pipeline = self._pipeline()
+        pipeline.seven_zip_path = "7z"
+        progress = []
+
+        with (
+            mock.patch.object(packaging_utils.subprocess, "Popen", return_value=Process()),
+            mock.patch.object(
+                packaging_utils.queue,
+                "Queue",
+                return_value=SimpleNamespace(get=lambda timeout: next(output)),
+            ),
+            mock.patch.object(
+                packaging_utils.threading,
+                "Thread",
+                return_value=SimpleNamespace(start=lambda: None, join=lambda timeout: None),
+            ),
+        ):
+            with self.assertRaisesRegex(PackagingError, "déjà full"):
+                pipeline._zip_with_7z(
+                    self.destination / "package.zip",
+                    self.content_dir,
+                    SimpleNamespace(archive_members=("Content/People/file.duf",)),
+                    progress.append,
+                )
+
+        self.assertEqual(progress, [12, 40])
 
     def test_public_validation_is_side_effect_free_and_checks_daz_roots(self):
         spec = self._spec()
@@ -224,6 +291,17 @@ class PackagingPipelineTests(PackagingTestCase):
         with self.assertRaisesRegex(PackagingError, "recognized DAZ root"):
             validate_package_spec(spec, ["Runtime"])
 
+    def test_content_check_reports_files_below_recognized_roots(self):
+        self.assertEqual(
+            check_package_content(self.content_dir, ["people"]), (True, None)
+        )
+        self.assertEqual(
+            check_package_content(self.content_dir, ["Runtime"]), (False, None)
+        )
+        has_files, error = check_package_content(self.root / "missing", ["People"])
+        self.assertFalse(has_files)
+        self.assertTrue(error)
+
     def test_empty_recognized_root_is_not_packageable_content(self):
         (self.content_dir / "People" / "Example" / "Product.duf").unlink()
         (self.content_dir / "Runtime").mkdir()
@@ -458,6 +536,204 @@ class PackagingPipelineTests(PackagingTestCase):
         self.assertEqual(result.status, PackageStatus.CANCELLED)
         self.assertEqual(final_path.read_bytes(), old_bytes)
 
+    def test_progress_skips_repeated_reports(self):
+        for index in range(20):
+            self._write(f"Runtime/Textures/file{index}.png", b"x")
+        reports = []
+
+        result = self._pipeline().execute(
+            progress=lambda percent, stage: reports.append((percent, stage))
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(reports[-1], (100, "Complete"))
+        self.assertFalse(
+            any(first == second for first, second in zip(reports, reports[1:]))
+        )
+
+    def test_zip_progress_reports_each_percent_once(self):
+        entries = []
+        for index in range(300):
+            path = self._write(f"Runtime/Textures/file{index}.txt", b"x")
+            entries.append(
+                packaging_utils.PackageInventoryEntry(
+                    str(path), f"Content/Runtime/Textures/file{index}.txt", 1
+                )
+            )
+        reports = []
+
+        self._pipeline()._zip_with_zipfile(
+            self.root / "package.zip", PackageInventory(tuple(entries)), reports.append
+        )
+
+        self.assertEqual(reports, sorted(set(reports)))
+        self.assertEqual(reports[-1], 100)
+        self.assertLessEqual(len(reports), 101)
+
+    def test_parallel_deflate_keeps_order_and_content_around_streamed_members(self):
+        payloads = {
+            f"Runtime/Textures/small{index}.txt": f"small {index} ".encode() * 50
+            for index in range(6)
+        }
+        payloads["Runtime/Textures/large.bin"] = os.urandom(2048)
+        for relative, value in payloads.items():
+            self._write(relative, value)
+        pipeline = self._pipeline()
+
+        with mock.patch.object(packaging_utils, "PARALLEL_DEFLATE_MAX_BYTES", 1024):
+            result = pipeline.execute()
+
+        self.assertTrue(result.success, result.message)
+        with zipfile.ZipFile(result.final_path) as archive:
+            self.assertIsNone(archive.testzip())
+            names = archive.namelist()
+            manifest = ElementTree.fromstring(archive.read("Manifest.dsx"))
+            for relative, value in payloads.items():
+                self.assertEqual(archive.read(f"Content/{relative}"), value)
+        manifest_names = [element.attrib["VALUE"] for element in manifest.findall("File")]
+        content_names = [name for name in names if name.startswith("Content/")]
+        self.assertEqual(content_names, manifest_names)
+
+    def test_precompressed_members_are_stored_individually(self):
+        texture = os.urandom(2048)
+        self._write("Runtime/Textures/skin.png", texture)
+        self._write("Runtime/Textures/large.jpg", texture * 2)
+        self._write("People/readme.txt", b"plain text " * 800)
+        self._write("Scripts/Example/apply.dsa", b"// DAZ Script\n" * 200)
+        plain_scene = b'{"file_version": "0.6.0.0"}\n' * 100
+        gzipped_scene = gzip.compress(os.urandom(2048))
+        self._write("People/plain.duf", plain_scene)
+        self._write("People/large_plain.dsf", plain_scene * 4)
+        self._write("People/gzipped.duf", gzipped_scene)
+        self._write("People/large_gzipped.dsf", gzip.compress(os.urandom(4096)))
+        pipeline = self._pipeline()
+
+        with mock.patch.object(packaging_utils, "PARALLEL_DEFLATE_MAX_BYTES", 3000):
+            result = pipeline.execute()
+
+        self.assertTrue(result.success, result.message)
+        with zipfile.ZipFile(result.final_path) as archive:
+            self.assertIsNone(archive.testzip())
+            for name, expected in (
+                ("Content/Runtime/Textures/skin.png", zipfile.ZIP_STORED),
+                ("Content/Runtime/Textures/large.jpg", zipfile.ZIP_STORED),
+                ("Content/People/readme.txt", zipfile.ZIP_DEFLATED),
+                ("Content/Scripts/Example/apply.dsa", zipfile.ZIP_DEFLATED),
+                ("Content/People/plain.duf", zipfile.ZIP_DEFLATED),
+                ("Content/People/large_plain.dsf", zipfile.ZIP_DEFLATED),
+                ("Content/People/gzipped.duf", zipfile.ZIP_STORED),
+                ("Content/People/large_gzipped.dsf", zipfile.ZIP_STORED),
+            ):
+                with self.subTest(name=name):
+                    self.assertEqual(archive.getinfo(name).compress_type, expected)
+            self.assertEqual(
+                archive.read("Content/Runtime/Textures/large.jpg"), texture * 2
+            )
+            self.assertEqual(archive.read("Content/People/plain.duf"), plain_scene)
+            self.assertEqual(archive.read("Content/People/gzipped.duf"), gzipped_scene)
+
+    def test_mostly_precompressed_content_is_stored_unless_profile_is_small(self):
+        self._write("Runtime/Textures/skin.jpg", b"j" * 4096)
+        self._write("People/readme.txt", b"t" * 256)
+
+        stored = self._pipeline().execute()
+        self.assertTrue(stored.success, stored.message)
+        with zipfile.ZipFile(stored.final_path) as archive:
+            info = archive.getinfo("Content/Runtime/Textures/skin.jpg")
+            self.assertEqual(info.compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(archive.read(info), b"j" * 4096)
+
+        small = self._pipeline(compression_profile="small", replace_existing=True).execute()
+        self.assertTrue(small.success, small.message)
+        with zipfile.ZipFile(small.final_path) as archive:
+            info = archive.getinfo("Content/Runtime/Textures/skin.jpg")
+            self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+
+        unknown = self._pipeline(compression_profile="ultra").execute()
+        self.assertEqual(unknown.status, PackageStatus.FAILED)
+
+    def test_streamed_manifest_matches_prettified_tree(self):
+        members = ("Content/People/A & B <x>.duf", 'Content/People/"quoted".duf')
+        inventory = PackageInventory(
+            tuple(
+                packaging_utils.PackageInventoryEntry(str(self.root), member, 1)
+                for member in members
+            )
+        )
+        pipeline = self._pipeline()
+        pipeline._normalized_guid = "guid"
+        root = ElementTree.Element("DAZInstallManifest", VERSION="0.1")
+        ElementTree.SubElement(root, "GlobalID", VALUE="guid")
+        for member in members:
+            ElementTree.SubElement(
+                root, "File", TARGET="Content", ACTION="Install", VALUE=member
+            )
+
+        ElementTree.indent(root, space="  ")
+
+        pipeline._create_manifest(self.root, inventory)
+
+        self.assertEqual(
+            (self.root / "Manifest.dsx").read_text(encoding="utf-8"),
+            ElementTree.tostring(root, encoding="unicode") + "\n",
+        )
+
+    def test_supplement_is_written_in_the_prettified_layout(self):
+        pipeline = self._pipeline(product_name="Rock & <Roll>")
+        root = ElementTree.Element("ProductSupplement", VERSION="0.1")
+        ElementTree.SubElement(root, "ProductName", VALUE="Rock & <Roll>")
+        ElementTree.SubElement(root, "InstallTypes", VALUE="Content")
+        ElementTree.SubElement(root, "ProductTags", VALUE="DAZStudio4_5")
+
+        ElementTree.indent(root, space="  ")
+
+        pipeline._create_supplement(self.root)
+
+        self.assertEqual(
+            (self.root / "Supplement.dsx").read_bytes(),
+            (ElementTree.tostring(root, encoding="unicode") + "\n").encode("utf-8"),
+        )
+
+    def test_cover_reuses_existing_support_directory_casing(self):
+        cover_name = build_support_cover_filename("Renderotica", "70127", "Temple Ruins")
+        self._write("runtime/support/old.dsx", b"old support")
+        self._write(f"runtime/support/{cover_name.upper()}", b"stale cover")
+        image_path = self.root / "cover.png"
+        Image.new("RGB", (60, 40), (0, 128, 255)).save(image_path)
+
+        result = self._pipeline(image_path=str(image_path)).execute()
+
+        self.assertTrue(result.success, result.message)
+        with zipfile.ZipFile(result.final_path) as archive:
+            names = archive.namelist()
+            manifest = ElementTree.fromstring(archive.read("Manifest.dsx"))
+        self.assertIn(f"Content/runtime/support/{cover_name}", names)
+        self.assertIn("Content/runtime/support/old.dsx", names)
+        self.assertNotIn(f"Content/runtime/support/{cover_name.upper()}", names)
+        self.assertFalse(any(name.startswith("Content/Runtime/") for name in names))
+        self.assertIn(
+            f"Content/runtime/support/{cover_name}",
+            {element.attrib["VALUE"] for element in manifest.findall("File")},
+        )
+
+    def test_large_jpeg_cover_is_draft_decoded_to_thumbnail_size(self):
+        image_path = self.root / "cover.jpg"
+        Image.new("RGB", (2400, 1600), (0, 128, 255)).save(image_path, "JPEG")
+        pipeline = self._pipeline(image_path=str(image_path))
+
+        with mock.patch.object(
+            Image.Image, "draft", autospec=True, side_effect=Image.Image.draft
+        ) as draft:
+            result = pipeline.execute()
+
+        self.assertTrue(result.success, result.message)
+        draft.assert_called_once()
+        cover_name = build_support_cover_filename("Renderotica", "70127", "Temple Ruins")
+        with zipfile.ZipFile(result.final_path) as archive:
+            with archive.open(f"Content/Runtime/Support/{cover_name}") as cover:
+                with Image.open(cover) as thumbnail:
+                    self.assertEqual(thumbnail.size, (300, 200))
+
     def test_cancellation_during_zip_is_cooperative_and_atomic(self):
         spec = self._spec()
         final_path = self._output_path(spec)
@@ -520,6 +796,28 @@ class PackagingPipelineTests(PackagingTestCase):
         self.assertEqual(len(completed), 2)
         self.assertTrue(all(result[4] == "" for result in completed))
 
+    def test_content_check_reports_unexpected_errors(self):
+        worker = packaging_utils.PackageContentCheckWorker(
+            {"Build1": str(self.content_dir)}, ("People",), False
+        )
+        results = []
+        errors = []
+        worker.resultReady.connect(results.append)
+        worker.error.connect(errors.append)
+
+        with (
+            mock.patch.object(
+                packaging_utils,
+                "check_package_content",
+                side_effect=RuntimeError("scanner crashed"),
+            ),
+            self.assertLogs(packaging_utils.log.name, "ERROR"),
+        ):
+            worker.run()
+
+        self.assertEqual(results, [])
+        self.assertEqual(errors, ["scanner crashed"])
+
     @unittest.skipUnless(find_7z_executable(), "7-Zip is not installed")
     def test_real_7z_backend_uses_the_same_verified_inventory(self):
         spec = self._spec(replace_existing=True)
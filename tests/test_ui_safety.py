@@ -14,6 +14,7 @@ from PySide6.QtWidgets import QApplication, QMessageBox, QWidget
 
 import app as app_module
 import extraction_utils as extraction_module
+import packaging_utils
 import widgets as widgets_module
 from app import DIMPackageGUI
 from dialogs.exit_dialog import ExitDialog
@@ -103,6 +104,20 @@ class OperationStateTests(unittest.TestCase):
         self.assertFalse(gui.generate_guid_button.enabled)
         self.assertFalse(gui.sync_container_widget.enabled)
 
+    def test_busy_to_busy_transition_leaves_widgets_untouched(self):
+        gui = SimpleNamespace(
+            operation_state=OperationState.PACKAGING,
+            _save_timer=_StubTimer(),
+            image_label=_StubImage(),
+            tags_button=_StubWidget(),
+        )
+        gui.tags_button.setEnabled = lambda _enabled: self.fail("widget toggled")
+
+        DIMPackageGUI._setOperationState(gui, OperationState.CLOSING)
+
+        self.assertIs(gui.operation_state, OperationState.CLOSING)
+        self.assertEqual(gui._save_timer.stopped, 1)
+
     def test_by_date_packaging_rejects_a_build_target_before_creating_it(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             builds_root = Path(temp_dir) / "Builds"
@@ -112,7 +127,7 @@ class OperationStateTests(unittest.TestCase):
             gui = SimpleNamespace(
                 canMutateWorkspace=lambda: True,
                 session=SimpleNamespace(builds=[build]),
-                _validateBuildsForPackaging=lambda builds: [
+                _validateBuildsForPackaging=lambda builds, checks=None: [
                     {"build": build, "status": "ready"}
                 ],
                 last_destination_folder=str(content_root),
@@ -141,7 +156,7 @@ class OperationStateTests(unittest.TestCase):
                 ),
                 patch.object(app_module, "show_error") as show_error,
             ):
-                DIMPackageGUI._packageBuilds(gui, [build])
+                DIMPackageGUI._reviewAndPackageBuilds(gui, [build])
 
             expected_date = content_root / app_module.date.today().strftime("%Y-%m-%d")
             self.assertFalse(expected_date.exists())
@@ -185,6 +200,7 @@ class OperationStateTests(unittest.TestCase):
             _runningWorkers=lambda: [],
             hasUserMadeChanges=lambda: False,
             _setOperationState=states.append,
+            _close_tip=lambda _attr: None,
             saveSettings=lambda: None,
             saveSession=lambda: False,
         )
@@ -992,7 +1008,7 @@ class SessionPreferenceAndGuidTests(unittest.TestCase):
         )
 
         with patch.object(
-            app_module.PackageInventory, "from_content", return_value=inventory
+            packaging_utils.PackageInventory, "from_content", return_value=inventory
         ):
             result = DIMPackageGUI._validateBuildsForPackaging(gui, [build])
 
@@ -1,7 +1,9 @@
 import os
+import stat
 import tempfile
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import utils
@@ -82,6 +84,20 @@ class ArchiveToolDiscoveryTests(unittest.TestCase):
             self.assertEqual(discovered, os.path.realpath(tool))
 
 
+class ReparsePointTests(unittest.TestCase):
+    def test_stat_check_flags_symlinks_and_windows_reparse_attributes(self):
+        flag = getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400)
+        self.assertTrue(utils.stat_is_link_or_reparse(
+            SimpleNamespace(st_mode=stat.S_IFLNK)
+        ))
+        self.assertFalse(utils.stat_is_link_or_reparse(
+            SimpleNamespace(st_mode=stat.S_IFDIR, st_file_attributes=0)
+        ))
+        self.assertTrue(utils.stat_is_link_or_reparse(
+            SimpleNamespace(st_mode=stat.S_IFDIR, st_file_attributes=flag)
+        ))
+
+
 class ManagedBuildPathTests(unittest.TestCase):
     def test_cleanup_preflights_reparse_points_before_deleting_anything(self):
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -122,6 +138,99 @@ class ManagedBuildPathTests(unittest.TestCase):
             self.assertTrue(content.is_dir())
             self.assertEqual(list(content.iterdir()), [])
 
+    def test_cleanup_removes_nested_and_read_only_entries(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            builds = Path(temp_dir) / "Builds"
+            build = builds / "Build001"
+            nested = build / "Content" / "Runtime" / "Textures" / "Example"
+            nested.mkdir(parents=True)
+            locked = nested / "locked.png"
+            locked.write_bytes(b"texture")
+            locked.chmod(stat.S_IREAD)
+            (build / "Content" / "data").mkdir()
+            (build / "Manifest.dsx").write_bytes(b"<manifest/>")
+
+            with patch.object(utils, "BUILDS_DIR", str(builds)):
+                utils.clean_build_content("Build001")
+
+            self.assertEqual(
+                sorted(path.name for path in build.iterdir()), ["Content"]
+            )
+            self.assertEqual(list((build / "Content").iterdir()), [])
+
+    def test_cleanup_does_not_descend_into_reparse_directories(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            builds = Path(temp_dir) / "Builds"
+            junction = builds / "Build001" / "Content" / "Runtime" / "junction"
+            junction.mkdir(parents=True)
+            outside = junction / "outside.png"
+            outside.write_bytes(b"not ours")
+            real_check = utils.entry_is_link_or_reparse
+
+            with (
+                patch.object(utils, "BUILDS_DIR", str(builds)),
+                patch.object(utils, "_assert_regular_build_tree"),
+                patch.object(
+                    utils,
+                    "entry_is_link_or_reparse",
+                    side_effect=lambda entry: entry.name == "junction" or real_check(entry),
+                ),
+                patch.object(utils.os, "unlink", wraps=os.unlink) as unlink,
+            ):
+                with self.assertRaisesRegex(OSError, "incomplete"):
+                    utils.clean_build_content("Build001")
+
+            unlink.assert_any_call(str(junction))
+            self.assertTrue(outside.is_file())
+
+    def test_cleanup_reports_every_failed_unlink_once(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            builds = Path(temp_dir) / "Builds"
+            nested = builds / "Build001" / "Content" / "Runtime" / "Textures"
+            nested.mkdir(parents=True)
+            for name in ("busy1.png", "busy2.png", "free.png"):
+                (nested / name).write_bytes(b"texture")
+            real_unlink = os.unlink
+
+            def unlink(path):
+                if os.path.basename(path).startswith("busy"):
+                    raise OSError("file in use")
+                real_unlink(path)
+
+            with (
+                patch.object(utils, "BUILDS_DIR", str(builds)),
+                patch.object(utils.os, "unlink", side_effect=unlink),
+            ):
+                with self.assertRaises(OSError) as raised:
+                    utils.clean_build_content("Build001")
+
+            message = str(raised.exception)
+            self.assertIn("2 entries failed", message)
+            self.assertIn("busy1.png: file in use", message)
+            self.assertIn("busy2.png: file in use", message)
+            self.assertNotIn("not empty", message)
+            self.assertFalse((nested / "free.png").exists())
+
+    def test_cleanup_unlinks_files_of_a_single_tree_individually(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            builds = Path(temp_dir) / "Builds"
+            content = builds / "Build001" / "Content"
+            for index in range(6):
+                folder = content / "Runtime" / f"Set{index % 2}"
+                folder.mkdir(parents=True, exist_ok=True)
+                (folder / f"file{index}.png").write_bytes(b"texture")
+
+            with (
+                patch.object(utils, "BUILDS_DIR", str(builds)),
+                patch.object(
+                    utils, "_unlink_build_file", wraps=utils._unlink_build_file
+                ) as unlink,
+            ):
+                utils.clean_build_content("Build001")
+
+            self.assertEqual(unlink.call_count, 6)
+            self.assertEqual(list(content.iterdir()), [])
+
 
 if __name__ == "__main__":
     unittest.main()
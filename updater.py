@@ -23,6 +23,7 @@ from logger_utils import get_logger
 log = get_logger(__name__)
 
 GITHUB_LATEST_API = "https://api.github.com/repos/H1ghSyst3m/DIM-Creator/releases/latest"
+_LEADING_DIGITS = re.compile(r'^(\d+)')
 
 
 @dataclass
@@ -48,7 +49,7 @@ def _to_tuple(v: str):
     parts = [p for p in _normalize_version(v).split('.') if p != ""]
     out = []
     for p in parts:
-        m = re.match(r'^(\d+)', p)
+        m = _LEADING_DIGITS.match(p)
         out.append(int(m.group(1)) if m else 0)
     while len(out) < 3:
         out.append(0)
@@ -4,6 +4,7 @@ import re
 import subprocess
 import shutil
 import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PySide6.QtCore import QFile, QStandardPaths, Qt
 from qfluentwidgets import InfoBar, InfoBarPosition
@@ -45,7 +46,10 @@ SESSION_BACKUPS_DIR = os.path.join(SESSIONS_DIR, "backups")
 ASSETS_DIR = os.path.join(DOC_MAIN_DIR, "Assets")
 COVERS_DIR = os.path.join(ASSETS_DIR, "Covers")
 
+_BUILD_FOLDER_NAME = re.compile(r'^Build\d+$')
+
 IGNORE_SYSTEM_FILES = {'.DS_Store', 'Thumbs.db', 'desktop.ini', '__MACOSX'}
+MAX_CLEANUP_WORKERS = 8
 
 
 def hidden_subprocess_kwargs() -> dict:
@@ -249,11 +253,28 @@ def safe_child_path(root: str, parent: str, name: str) -> str:
     return result
 
 
+def stat_is_link_or_reparse(info: os.stat_result) -> bool:
+    if stat.S_ISLNK(info.st_mode):
+        return True
+    attributes = getattr(info, "st_file_attributes", 0)
+    return bool(attributes & getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400))
+
+
+def entry_is_link_or_reparse(entry: os.DirEntry) -> bool:
+    if entry.is_symlink():
+        return True
+    if os.name != "nt":
+        # Reparse attributes only exist on Windows; skip the extra stat.
+        return False
+    try:
+        return stat_is_link_or_reparse(entry.stat(follow_symlinks=False))
+    except OSError:
+        return True
+
+
 def has_reparse_point(path: str) -> bool:
     try:
-        attrs = getattr(os.lstat(path), "st_file_attributes", 0)
-        flag = getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400)
-        return os.path.islink(path) or bool(attrs & flag)
+        return stat_is_link_or_reparse(os.lstat(path))
     except OSError:
         return True
 
@@ -280,15 +301,22 @@ QToolTip {
 }
 """
 
-label_stylesheet = """\
-QLabel {
+
+def _label_stylesheet(selector: str = "QLabel") -> str:
+    return f"""\
+{selector} {{
     color: white;
     font-family: 'Segoe UI';
     font-size: 10pt;
-}
+}}
 """
 
 
+label_stylesheet = _label_stylesheet()
+
+form_label_stylesheet = _label_stylesheet("QLabel#formLabel")
+
+
 def show_warning(parent, title, content, orient=Qt.Horizontal, position=InfoBarPosition.TOP_RIGHT,
                  closable=True, duration=2000):
     InfoBar.warning(title=title, content=content, orient=orient, isClosable=closable,
@@ -328,11 +356,10 @@ def format_file_size(size_bytes):
 
 
 def ensure_builds_directory_structure():
-    os.makedirs(DOC_MAIN_DIR, exist_ok=True)
-    os.makedirs(BUILDS_DIR, exist_ok=True)
-    os.makedirs(SESSIONS_DIR, exist_ok=True)
-    os.makedirs(SESSION_BACKUPS_DIR, exist_ok=True)
-    os.makedirs(COVERS_DIR, exist_ok=True)
+    # The leaves imply their parents, so an existing tree costs one stat each.
+    for directory in (BUILDS_DIR, SESSION_BACKUPS_DIR, COVERS_DIR):
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
 
 
 def _validate_folder_name(folder_name: str) -> None:
@@ -342,7 +369,7 @@ def _validate_folder_name(folder_name: str) -> None:
     if '/' in folder_name or '\\' in folder_name or '..' in folder_name:
         raise ValueError(f"folder_name contains invalid path separators or traversal sequences: {folder_name}")
     
-    if not re.match(r'^Build\d+$', folder_name):
+    if not _BUILD_FOLDER_NAME.match(folder_name):
         raise ValueError(f"folder_name must match pattern 'Build' followed by one or more digits (e.g., 'Build1', 'Build01', 'Build123'): {folder_name}")
 
 
@@ -407,33 +434,105 @@ def _handle_readonly_error(func, path, exc):
     func(path)
 
 
+def _remove_writable(func, path: str) -> None:
+    try:
+        func(path)
+    except PermissionError as exc:
+        _handle_readonly_error(func, path, exc)
+
+
+def _collect_tree(path: str, files: list[str], directories: list[str]) -> None:
+    # Links and junctions are unlinked themselves and never descended into;
+    # os.unlink removes directory junctions on Windows without following them.
+    pending = [path]
+    visited = []
+    while pending:
+        current = pending.pop()
+        visited.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if not entry_is_link_or_reparse(entry) and entry.is_dir(
+                    follow_symlinks=False
+                ):
+                    pending.append(entry.path)
+                else:
+                    files.append(entry.path)
+    # Every directory is visited after its parent, so reversed is bottom-up.
+    directories.extend(reversed(visited))
+
+
+def _unlink_build_file(path: str) -> str | None:
+    try:
+        _remove_writable(os.unlink, path)
+    except Exception as e:
+        return f"{path}: {e}"
+    return None
+
+
 def clean_build_content(folder_name: str) -> None:
     build_path = _checked_build_path(folder_name)
-    
+
     if not os.path.isdir(build_path):
         return
     _assert_regular_build_tree(build_path)
-    
+
+    # A build is mostly one large Content tree, so the pool works on
+    # individual files; directories are then removed bottom-up.
+    files: list[str] = []
+    directories: list[str] = []
     failures = []
-    for item in os.listdir(build_path):
-        item_path = os.path.join(build_path, item)
+    with os.scandir(build_path) as iterator:
+        for entry in iterator:
+            try:
+                if entry_is_link_or_reparse(entry) or not entry.is_dir(
+                    follow_symlinks=False
+                ):
+                    files.append(entry.path)
+                else:
+                    _collect_tree(entry.path, files, directories)
+            except OSError as e:
+                failures.append(f"{entry.name}: {e}")
+    if failures:
+        # Nothing has been deleted yet; do not start on a partial plan.
+        raise OSError("Build cleanup could not scan the build: " + "; ".join(failures))
+
+    failed_paths = []
+    if files:
+        workers = min(MAX_CLEANUP_WORKERS, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for path, failure in zip(files, executor.map(_unlink_build_file, files)):
+                if failure:
+                    failures.append(failure)
+                    failed_paths.append(path)
+    # Parents of a file that could not be removed are left in place instead
+    # of adding a "directory not empty" error per ancestor to the summary.
+    kept = {os.path.dirname(path) for path in failed_paths}
+    for directory in directories:
+        if directory in kept:
+            kept.add(os.path.dirname(directory))
+            continue
         try:
-            if os.path.isfile(item_path):
-                os.unlink(item_path)
-            elif os.path.isdir(item_path):
-                shutil.rmtree(item_path, onerror=_handle_readonly_error)
-        except Exception as e:
-            failures.append(f"{item}: {e}")
+            _remove_writable(os.rmdir, directory)
+        except OSError as e:
+            failures.append(f"{directory}: {e}")
+            kept.add(os.path.dirname(directory))
 
     try:
         remaining = os.listdir(build_path)
     except OSError as exc:
         remaining = []
         failures.append(str(exc))
-    if remaining:
-        failures.extend(f"still present: {item}" for item in remaining)
     if failures:
-        raise OSError("Build cleanup was incomplete: " + "; ".join(failures))
+        raise OSError(
+            f"Build cleanup was incomplete ({len(failures)} "
+            f"{'entry' if len(failures) == 1 else 'entries'} failed): "
+            + "; ".join(failures)
+        )
+    if remaining:
+        raise OSError(
+            "Build cleanup was incomplete: "
+            + "; ".join(f"still present: {item}" for item in remaining)
+        )
     
     content_dir = os.path.join(build_path, "Content")
     os.makedirs(content_dir, exist_ok=True)
@@ -452,7 +551,7 @@ def delete_all_build_folders(handle_error_callback=None) -> list[str]:
         for item in os.listdir(BUILDS_DIR):
             item_path = os.path.join(BUILDS_DIR, item)
 
-            if os.path.lexists(item_path) and re.match(r'^Build\d+$', item):
+            if os.path.lexists(item_path) and _BUILD_FOLDER_NAME.match(item):
                 try:
                     item_path = _checked_build_path(item)
                     if not os.path.isdir(item_path):
@@ -78,9 +78,7 @@ class TagSelectionDialog(QDialog):
         setTheme(Theme.DARK)
         self.resize(450, 370)
 
-        if selected_tags is None:
-            selected_tags = []
-        self.selected_tags = selected_tags
+        self.selected_tags = set(selected_tags or ())
 
         self.layout = QVBoxLayout(self)
 